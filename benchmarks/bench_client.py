@@ -0,0 +1,193 @@
+"""Measure GuardCoreApi calls end to end against the local stub server.
+
+For every scenario and concurrency level this records throughput, latency
+percentiles and the peak traced memory, prints a table and writes the
+results as JSON so runs can be compared over time.
+
+Run from the repository root: ``python -m benchmarks.bench_client``.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from importlib import metadata
+
+from guardcoreapi import GuardCoreApi
+from guardcoreapi.core import RequestCore
+
+from . import stub_server
+
+API_KEY = "benchmark"
+
+Call = Callable[[int], Awaitable[object]]
+
+
+def _scenarios(args: argparse.Namespace) -> dict[str, tuple[Call, bool]]:
+    """Map scenario names to ``(call, heavy)``; heavy ones run fewer times."""
+    pages = max(1, args.subscriptions // 100)
+    return {
+        "get_subscription": (
+            lambda i: GuardCoreApi.get_subscription(f"user_{i:06d}", api_key=API_KEY),
+            False,
+        ),
+        "enable_subscription": (
+            lambda i: GuardCoreApi.enable_subscription(
+                f"user_{i:06d}", api_key=API_KEY
+            ),
+            False,
+        ),
+        "get_guard": (lambda i: GuardCoreApi.get_guard(f"{i:016x}"), False),
+        "get_all_subscriptions[size=100]": (
+            lambda i: GuardCoreApi.get_all_subscriptions(
+                api_key=API_KEY, page=i % pages + 1, size=100
+            ),
+            False,
+        ),
+        "get_subscription_usages": (
+            lambda i: GuardCoreApi.get_subscription_usages(
+                f"user_{i:06d}", api_key=API_KEY
+            ),
+            True,
+        ),
+        "get_admin_subscriptions": (
+            lambda i: GuardCoreApi.get_admin_subscriptions(
+                "reseller_00", api_key=API_KEY
+            ),
+            True,
+        ),
+        "fetch_all_subscriptions": (
+            lambda i: GuardCoreApi.fetch_all_subscriptions(api_key=API_KEY),
+            True,
+        ),
+    }
+
+
+async def _run(call: Call, calls: int, concurrency: int) -> tuple[float, list[float]]:
+    latencies: list[float] = []
+    remaining = iter(range(calls))
+
+    async def worker() -> None:
+        for index in remaining:
+            started = time.perf_counter()
+            await call(index)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    async with asyncio.TaskGroup() as group:
+        for _ in range(min(concurrency, calls)):
+            group.create_task(worker())
+    return time.perf_counter() - started, latencies
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))] * 1000
+
+
+async def _measure(call: Call, calls: int, concurrency: int) -> dict:
+    await _run(call, min(calls, concurrency), concurrency)  # warm up
+    elapsed, latencies = await _run(call, calls, concurrency)
+    ordered = sorted(latencies)
+
+    # tracemalloc slows allocation-heavy code down, so memory is measured in
+    # a separate, shorter pass.
+    tracemalloc.start()
+    await _run(call, concurrency, concurrency)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "calls": calls,
+        "concurrency": concurrency,
+        "seconds": elapsed,
+        "throughput": calls / elapsed,
+        "latency_ms": {
+            "p50": _percentile(ordered, 0.5),
+            "p90": _percentile(ordered, 0.9),
+            "p99": _percentile(ordered, 0.99),
+            "max": ordered[-1] * 1000,
+        },
+        "peak_memory_kib": peak / 1024,
+    }
+
+
+async def _bench(args: argparse.Namespace, base_url: str) -> list[dict]:
+    core = RequestCore.default()
+    core.base_url = base_url
+    await GuardCoreApi.startup(limit=max(args.concurrency))
+    selected = set(args.scenario or [])
+    results = []
+    try:
+        for name, (call, heavy) in _scenarios(args).items():
+            if selected and name not in selected:
+                continue
+            calls = args.heavy_calls if heavy else args.calls
+            for concurrency in args.concurrency:
+                if heavy and concurrency > args.heavy_concurrency:
+                    continue
+                result = {"scenario": name, **await _measure(call, calls, concurrency)}
+                results.append(result)
+                latency = result["latency_ms"]
+                print(
+                    f"{name:<34}{concurrency:>5}{result['throughput']:>10.1f}"
+                    f"{latency['p50']:>9.2f}{latency['p99']:>9.2f}"
+                    f"{result['peak_memory_kib'] / 1024:>10.1f}"
+                )
+    finally:
+        await GuardCoreApi.shutdown()
+    return results
+
+
+def _version() -> str | None:
+    try:
+        return metadata.version("guardcoreapi")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--subscriptions", type=int, default=10000)
+    parser.add_argument("--usage-logs", type=int, default=10000)
+    parser.add_argument("--delay", type=float, default=0.0)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--heavy-calls", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50, 100])
+    parser.add_argument("--heavy-concurrency", type=int, default=10)
+    parser.add_argument("--scenario", action="append")
+    parser.add_argument("--output", default="benchmark-results.json")
+    args = parser.parse_args()
+
+    process, base_url = stub_server.start_process(
+        args.subscriptions, args.usage_logs, args.delay
+    )
+    print(
+        f"{'scenario':<34}{'conc':>5}{'calls/s':>10}{'p50 ms':>9}{'p99 ms':>9}"
+        f"{'peak MiB':>10}"
+    )
+    try:
+        results = asyncio.run(_bench(args, base_url))
+    finally:
+        process.terminate()
+        process.join()
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "guardcoreapi": _version(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "options": {key: value for key, value in vars(args).items() if key != "output"},
+        "results": results,
+    }
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+    print(f"results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Compare JSON codecs on subscription payloads.
+
+Run from the repository root: ``python -m benchmarks.bench_codec``.
+"""
+
+import argparse
+import json
+import timeit
+
+from guardcoreapi.core import JSONCodec, MsgspecCodec, OrjsonCodec
+from guardcoreapi.types import SubscriptionCreate
+
+from . import payloads
+
+
+def _available_codecs() -> list[JSONCodec]:
+    codecs = [JSONCodec()]
+    for codec in (OrjsonCodec, MsgspecCodec):
+        try:
+            codecs.append(codec())
+        except ImportError:
+            pass
+    return codecs
+
+
+def _measure(func, repeat: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    create = [
+        SubscriptionCreate(**payloads.subscription_create(index)).model_dump()
+        for index in range(args.rows)
+    ]
+    body = json.dumps(payloads.subscriptions(args.rows)).encode()
+
+    print(f"{args.rows} rows, response body {len(body) / 1024:.0f} KiB")
+    print(f"{'codec':<22}{'encode ms':>12}{'decode ms':>12}")
+    # What aiohttp's ``json=`` argument and ``response.json()`` do.
+    encode = _measure(lambda: json.dumps(create).encode(), args.repeat)
+    decode = _measure(lambda: json.loads(body.decode("utf-8")), args.repeat)
+    print(f"{'aiohttp default':<22}{encode:>12.2f}{decode:>12.2f}")
+    for codec in _available_codecs():
+        encode = _measure(lambda: codec.dumps(create), args.repeat)
+        decode = _measure(lambda: codec.loads(body), args.repeat)
+        print(f"{codec.name:<22}{encode:>12.2f}{decode:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Measure cold import time of the package in fresh interpreters.
+
+Each statement runs in a new ``python`` process so nothing is cached in
+``sys.modules``; the median of ``--repeat`` runs is reported. The last row
+imports everything, which is what ``import guardcoreapi`` used to cost
+before the package namespaces became lazy.
+
+Run from the repository root: ``python -m benchmarks.bench_import``.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = {
+    "import guardcoreapi": "import guardcoreapi",
+    "core exceptions": "from guardcoreapi.core import RequestResponseError",
+    "one model": "from guardcoreapi.types import SubscriptionResponse",
+    "GuardCoreApi": "from guardcoreapi import GuardCoreApi",
+    "everything (eager)": (
+        "import guardcoreapi, guardcoreapi.core, guardcoreapi.types\n"
+        "for module in (guardcoreapi, guardcoreapi.core, guardcoreapi.types):\n"
+        "    [getattr(module, name) for name in module.__all__]"
+    ),
+}
+
+_TEMPLATE = """
+import sys, time
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+print(elapsed, "aiohttp" in sys.modules, "pydantic" in sys.modules)
+"""
+
+
+def _run(statement: str) -> tuple[float, bool, bool]:
+    output = subprocess.run(
+        [sys.executable, "-c", _TEMPLATE.format(statement=statement)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    return float(output[0]), output[1] == "True", output[2] == "True"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'import':<22}{'median ms':>11}{'aiohttp':>9}{'pydantic':>10}")
+    for name, statement in STATEMENTS.items():
+        runs = [_run(statement) for _ in range(args.repeat)]
+        median = statistics.median(run[0] for run in runs) * 1000
+        _, aiohttp, pydantic = runs[-1]
+        print(f"{name:<22}{median:>11.1f}{aiohttp!s:>9}{pydantic!s:>10}")
+
+
+if __name__ == "__main__":
+    main()
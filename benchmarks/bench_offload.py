@@ -0,0 +1,59 @@
+"""Compare event-loop lag with and without offloaded validation.
+
+Fetches a large subscription list and a long usage log from the stub
+server while a ``LoopLagMonitor`` runs, once validating inline and once
+with validation offloaded to a worker thread.
+
+Run from the repository root: ``python -m benchmarks.bench_offload``.
+"""
+
+import argparse
+import asyncio
+import time
+
+from guardcoreapi import GuardCoreClient
+from guardcoreapi.core import LoopLagMonitor
+
+from . import stub_server
+
+
+async def _measure(base_url: str, threshold: int | None, repeat: int) -> dict:
+    async with GuardCoreClient(
+        base_url=base_url, api_key="benchmark", offload_threshold=threshold
+    ) as client:
+        await client.get_subscription_usages("user_000000")  # warm up
+        async with LoopLagMonitor(interval=0.005) as monitor:
+            started = time.perf_counter()
+            for _ in range(repeat):
+                await client.get_admin_subscriptions("reseller_00")
+                await client.get_subscription_usages("user_000000")
+            elapsed = time.perf_counter() - started
+    return {"elapsed": elapsed, **monitor.stats()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--subscriptions", type=int, default=50000)
+    parser.add_argument("--usage-logs", type=int, default=100000)
+    parser.add_argument("--threshold", type=int, default=1048576)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    process, base_url = stub_server.start_process(args.subscriptions, args.usage_logs)
+    try:
+        print(
+            f"{'validation':<12}{'elapsed s':>11}{'p99 lag ms':>12}{'max lag ms':>12}"
+        )
+        for name, threshold in (("inline", None), ("offloaded", args.threshold)):
+            result = asyncio.run(_measure(base_url, threshold, args.repeat))
+            print(
+                f"{name:<12}{result['elapsed']:>11.2f}"
+                f"{result['p99'] * 1000:>12.1f}{result['max'] * 1000:>12.1f}"
+            )
+    finally:
+        process.terminate()
+        process.join()
+
+
+if __name__ == "__main__":
+    main()
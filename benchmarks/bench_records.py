@@ -0,0 +1,45 @@
+"""Measure retained memory per subscription: pydantic models vs records.
+
+Run from the repository root: ``python -m benchmarks.bench_records``.
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+
+from guardcoreapi.core.validation import type_adapter
+from guardcoreapi.types import SubscriptionRecord, SubscriptionResponse
+
+from . import payloads
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+
+    body = json.dumps(payloads.subscriptions(args.rows)).encode()
+    adapter = type_adapter(SubscriptionResponse, True)
+
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    models = adapter.validate_json(body)
+    model_bytes = tracemalloc.get_traced_memory()[0] - baseline
+    records = [SubscriptionRecord.from_model(model) for model in models]
+    assert records[-1].to_model() == models[-1]
+    # Records share the str/datetime values of the models; count them once
+    # the models are gone.
+    del models
+    gc.collect()
+    record_bytes = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    print(f"{args.rows} subscriptions")
+    print(f"{'SubscriptionResponse':<24}{model_bytes / args.rows:>10.0f} B/record")
+    print(f"{'SubscriptionRecord':<24}{record_bytes / args.rows:>10.0f} B/record")
+
+
+if __name__ == "__main__":
+    main()
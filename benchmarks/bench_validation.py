@@ -0,0 +1,54 @@
+"""Compare per-item model construction with cached TypeAdapter validation.
+
+Run from the repository root: ``python -m benchmarks.bench_validation``.
+"""
+
+import argparse
+import json
+import timeit
+
+from guardcoreapi.core import default_codec
+from guardcoreapi.core.validation import type_adapter
+from guardcoreapi.types import SubscriptionResponse
+
+from . import payloads
+
+
+def _measure(func, repeat: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    body = json.dumps(payloads.subscriptions(args.rows)).encode()
+    codec = default_codec()
+    adapter = type_adapter(SubscriptionResponse, True)
+
+    cases = {
+        # The previous RequestCore.fetch path.
+        "json.loads + Model(**item)": lambda: [
+            SubscriptionResponse(**item) for item in json.loads(body.decode("utf-8"))
+        ],
+        f"{codec.name}.loads + Model(**item)": lambda: [
+            SubscriptionResponse(**item) for item in codec.loads(body)
+        ],
+        f"{codec.name}.loads + validate_python": lambda: adapter.validate_python(
+            codec.loads(body)
+        ),
+        "TypeAdapter.validate_json": lambda: adapter.validate_json(body),
+    }
+
+    print(f"{args.rows} SubscriptionResponse rows, {len(body) / 1024:.0f} KiB")
+    baseline = None
+    for name, func in cases.items():
+        elapsed = _measure(func, args.repeat)
+        baseline = baseline or elapsed
+        print(f"{name:<40}{elapsed:>10.1f} ms{baseline / elapsed:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Synthetic, realistically sized Guard core payloads for the benchmarks."""
+
+from datetime import datetime, timedelta
+
+_EPOCH = datetime(2025, 1, 1)
+
+
+def _timestamp(index: int, offset: int = 0) -> str:
+    return (_EPOCH + timedelta(minutes=index * 7 + offset)).isoformat()
+
+
+def subscription(index: int) -> dict:
+    return {
+        "id": index + 1,
+        "username": f"user_{index:06d}",
+        "owner_username": f"reseller_{index % 25:02d}",
+        "access_key": f"{index:08x}" * 4,
+        "enabled": index % 17 != 0,
+        "activated": True,
+        "reached": index % 11 == 0,
+        "limited": index % 13 == 0,
+        "expired": index % 19 == 0,
+        "is_active": index % 7 != 0,
+        "is_online": index % 3 == 0,
+        "link": f"https://sub.example.com/guards/{index:08x}{index * 31:08x}",
+        "limit_usage": 107374182400,
+        "reset_usage": 0,
+        "total_usage": index * 1048576,
+        "current_usage": index * 524288,
+        "limit_expire": 2592000,
+        "auto_delete_days": 7,
+        "service_ids": [1, 2, 3 + index % 4],
+        "note": f"customer #{index} - renewed monthly" if index % 2 else None,
+        "telegram_id": str(100000000 + index) if index % 3 else None,
+        "discord_webhook_url": None,
+        "online_at": _timestamp(index, 5) if index % 3 == 0 else None,
+        "last_reset_at": _timestamp(index, 3) if index % 5 == 0 else None,
+        "last_revoke_at": None,
+        "last_request_at": _timestamp(index, 4),
+        "last_client_agent": "v2rayNG/1.8.19",
+        "created_at": _timestamp(index),
+        "updated_at": _timestamp(index, 2),
+        "auto_renewals": (
+            [
+                {
+                    "id": index,
+                    "limit_expire": 2592000,
+                    "limit_usage": 0,
+                    "reset_usage": True,
+                }
+            ]
+            if index % 4 == 0
+            else []
+        ),
+    }
+
+
+def subscriptions(count: int, start: int = 0) -> list[dict]:
+    return [subscription(index) for index in range(start, start + count)]
+
+
+def subscription_create(index: int) -> dict:
+    return {
+        "username": f"import_{index:06d}",
+        "limit_usage": 53687091200,
+        "limit_expire": 2592000,
+        "service_ids": [1, 2],
+        "access_key": None,
+        "note": f"migrated from panel A #{index}",
+        "telegram_id": None,
+        "discord_webhook_url": None,
+        "auto_delete_days": 7,
+        "auto_renewals": [],
+    }
+
+
+def usage_logs(count: int) -> list[dict]:
+    return [
+        {"usage": (index * 7919) % 104857600, "created_at": _timestamp(index)}
+        for index in range(count)
+    ]
+
+
+def node(index: int) -> dict:
+    return {
+        "id": index + 1,
+        "enabled": True,
+        "remark": f"node-{index:03d}",
+        "category": "marzneshin",
+        "username": "admin",
+        "password": "secret",
+        "host": f"https://node{index}.example.com",
+        "current_usage": index * 1073741824,
+        "last_used_at": _timestamp(index),
+        "usage_rate": 1.0,
+        "offset_link": 0,
+        "batch_size": 1,
+        "priority": index,
+        "created_at": _timestamp(index),
+        "updated_at": _timestamp(index, 1),
+    }
@@ -1,3 +1,42 @@
-from .manager import GuardCoreApi
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = ["GuardCoreApi"]
+if TYPE_CHECKING:
+    from .auth import TokenProvider
+    from .bulk import BulkItemResult, BulkReport
+    from .client import GuardCoreClient
+    from .guards import GuardCache
+    from .manager import GuardCoreApi
+
+# Submodules are imported on first attribute access (PEP 562), so importing
+# the package does not pull in aiohttp and pydantic until they are needed.
+_LAZY = {
+    "GuardCoreApi": ".manager",
+    "GuardCoreClient": ".client",
+    "GuardCache": ".guards",
+    "BulkItemResult": ".bulk",
+    "BulkReport": ".bulk",
+    "TokenProvider": ".auth",
+}
+
+__all__ = [
+    "GuardCoreApi",
+    "GuardCoreClient",
+    "GuardCache",
+    "BulkItemResult",
+    "BulkReport",
+    "TokenProvider",
+]
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
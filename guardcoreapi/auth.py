@@ -0,0 +1,113 @@
+import asyncio
+import base64
+import json
+import time
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from .client import GuardCoreClient
+
+
+def _claims(token: str) -> dict:
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(
+            base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        )
+    except (IndexError, TypeError, ValueError):
+        return {}
+    return claims if isinstance(claims, dict) else {}
+
+
+def _claim(claims: dict, name: str) -> Optional[float]:
+    try:
+        return float(claims[name])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def token_expiry(token: str) -> Optional[float]:
+    """Return the ``exp`` claim of a JWT as a Unix timestamp, if present."""
+    return _claim(_claims(token), "exp")
+
+
+class TokenProvider:
+    """Log in with admin credentials and keep the access token fresh.
+
+    The token is reused until ``refresh_margin`` seconds before it
+    expires. Its lifetime is taken as ``exp - iat`` of the JWT, both from
+    the core's clock, so a skewed local clock does not matter; without
+    ``iat`` it is ``exp`` minus the local time, and ``default_ttl`` when
+    that is not positive or the token carries no ``exp``. The margin is
+    capped at half the lifetime. Inside the margin the current token is
+    still handed out while one background login replaces it. Concurrent
+    callers share a single login, and ``refresh`` after a 401 logs in
+    again only once per stale token.
+    """
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        totp_code: Optional[str] = None,
+        refresh_margin: float = 60.0,
+        default_ttl: float = 3600.0,
+    ) -> None:
+        self.username = username
+        self.password = password
+        self.totp_code = totp_code
+        self.refresh_margin = refresh_margin
+        self.default_ttl = default_ttl
+        self.logins = 0
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._refresh_at = 0.0
+        self._login: Optional[asyncio.Task] = None
+
+    async def token(self, client: "GuardCoreClient") -> str:
+        now = time.monotonic()
+        if self._token is None or now >= self._expires_at:
+            return await asyncio.shield(self._start(client))
+        if now >= self._refresh_at:
+            self._start(client)
+        return self._token
+
+    async def refresh(self, client: "GuardCoreClient", stale: str) -> str:
+        """Return a token newer than ``stale``, logging in if needed."""
+        if self._token is not None and self._token != stale:
+            return self._token
+        if self._token == stale:
+            self._token = None
+        return await asyncio.shield(self._start(client))
+
+    def _start(self, client: "GuardCoreClient") -> asyncio.Task:
+        if self._login is None:
+            self._login = asyncio.ensure_future(self._authenticate(client))
+            self._login.add_done_callback(self._finished)
+        return self._login
+
+    def _finished(self, task: asyncio.Task) -> None:
+        self._login = None
+        if not task.cancelled():
+            task.exception()
+
+    async def _authenticate(self, client: "GuardCoreClient") -> str:
+        self.logins += 1
+        # Full validation whatever the client's mode, for a real AdminToken.
+        token = await client.generate_admin_token(
+            self.username, self.password, self.totp_code, validate="full"
+        )
+        ttl = self._ttl(token.access_token)
+        self._token = token.access_token
+        self._expires_at = time.monotonic() + ttl
+        self._refresh_at = self._expires_at - min(self.refresh_margin, ttl / 2)
+        return self._token
+
+    def _ttl(self, token: str) -> float:
+        claims = _claims(token)
+        expires = _claim(claims, "exp")
+        if expires is None:
+            return self.default_ttl
+        issued = _claim(claims, "iat")
+        ttl = expires - (time.time() if issued is None else issued)
+        return ttl if ttl > 0 else self.default_ttl
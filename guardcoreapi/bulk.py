@@ -0,0 +1,143 @@
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import TYPE_CHECKING, Any
+
+from .core import GuardCoreApiException, RequestResponseError
+from .types import SubscriptionCreate
+
+if TYPE_CHECKING:
+    from .client import GuardCoreClient
+
+
+@dataclass(slots=True)
+class BulkItemResult:
+    """Outcome of one item of a bulk operation."""
+
+    username: str
+    result: Any = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(slots=True)
+class BulkReport:
+    """Results of ``bulk_apply`` keyed by username."""
+
+    succeeded: dict[str, Any] = field(default_factory=dict)
+    failed: dict[str, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+
+def _chunks(items: Iterable, size: int) -> Iterable[list]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+# Statuses the core answers when it rejects rows of the body, as opposed to
+# being unavailable or overloaded.
+_ROW_REJECTED = frozenset({400, 409, 422})
+
+
+async def _create_chunk(
+    client: "GuardCoreClient",
+    chunk: list[SubscriptionCreate],
+    slots: asyncio.Semaphore,
+) -> list[BulkItemResult]:
+    try:
+        async with slots:
+            created = await client.create_subscription(chunk)
+    except GuardCoreApiException as error:
+        if (
+            len(chunk) == 1
+            or not isinstance(error, RequestResponseError)
+            or error.status not in _ROW_REJECTED
+        ):
+            return [BulkItemResult(item.username, error=error) for item in chunk]
+        # The core rejects the whole body for one bad row; retry the rows
+        # one by one, within the same concurrency, to find it and still
+        # create the rest.
+        rows = await asyncio.gather(
+            *(_create_chunk(client, [item], slots) for item in chunk)
+        )
+        return [result for row in rows for result in row]
+    by_username = {
+        row["username"] if isinstance(row, dict) else row.username: row
+        for row in created
+    }
+    return [
+        BulkItemResult(item.username, result=by_username.get(item.username))
+        for item in chunk
+    ]
+
+
+async def import_subscriptions(
+    client: "GuardCoreClient",
+    data: Iterable[SubscriptionCreate],
+    chunk_size: int = 100,
+    concurrency: int = 4,
+    skip: Iterable[str] = (),
+) -> AsyncIterator[BulkItemResult]:
+    skip = set(skip)
+    chunks = _chunks((item for item in data if item.username not in skip), chunk_size)
+    pending: set[asyncio.Task] = set()
+    slots = asyncio.Semaphore(concurrency)
+
+    def schedule() -> None:
+        for chunk in islice(chunks, concurrency - len(pending)):
+            pending.add(asyncio.ensure_future(_create_chunk(client, chunk, slots)))
+
+    try:
+        schedule()
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            schedule()
+            for task in done:
+                for result in task.result():
+                    yield result
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def bulk_apply(
+    client: "GuardCoreClient",
+    op: str | Callable[..., Awaitable[Any]],
+    usernames: Iterable[str],
+    concurrency: int = 16,
+    on_progress: Callable[[BulkItemResult, int, int], None] | None = None,
+    **kwargs,
+) -> BulkReport:
+    call = getattr(client, op) if isinstance(op, str) else op
+    usernames = list(dict.fromkeys(usernames))
+    remaining = iter(usernames)
+    report = BulkReport()
+
+    async def worker() -> None:
+        # Workers share one iterator, so each username is taken exactly once.
+        for username in remaining:
+            try:
+                result = BulkItemResult(username, await call(username, **kwargs))
+                report.succeeded[username] = result.result
+            except Exception as error:
+                result = BulkItemResult(username, error=error)
+                report.failed[username] = error
+            if on_progress is not None:
+                done = len(report.succeeded) + len(report.failed)
+                on_progress(result, done, len(usernames))
+
+    async with asyncio.TaskGroup() as group:
+        for _ in range(min(concurrency, len(usernames))):
+            group.create_task(worker())
+    return report
@@ -0,0 +1,998 @@
+import asyncio
+import functools
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from typing import Any
+
+from .auth import TokenProvider
+from .bulk import BulkItemResult, BulkReport, bulk_apply, import_subscriptions
+from .core import (
+    RequestAuthenticationError,
+    RequestCore,
+    ResponseCache,
+    ValidationMode,
+)
+from .types import (
+    AdminToken,
+    AdminResponse,
+    AdminCreate,
+    AdminCurrentUpdate,
+    AdminUsageLogsResponse,
+    AdminUpdate,
+    SubscriptionResponse,
+    SubscriptionCreate,
+    SubscriptionStatsResponse,
+    SubscriptionUpdate,
+    SubscriptionUsageLogsResponse,
+    NodeResponse,
+    NodeCreate,
+    NodeUpdate,
+    NodeStatsResponse,
+    ServiceCreate,
+    ServiceResponse,
+    ServiceUpdate,
+    SubscriptionStatusStatsResponse,
+    MostUsageSubscription,
+    UsageStatsResponse,
+    AgentStatsResponse,
+    LastReachedSubscriptionDetail,
+)
+
+_CURRENT_ADMIN = ("get_current_admin",)
+_NODES = ("get_nodes", "get_node", "get_node_stats")
+_SERVICES = ("get_services", "get_service")
+_SUBSCRIPTION_STATS = ("get_subscription_stats",)
+
+
+def _filter_params(**filters) -> dict:
+    return {key: value for key, value in filters.items() if value is not None}
+
+
+def _cached(method):
+    name = method.__name__
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        if self.cache is None:
+            return await method(self, *args, **kwargs)
+        key = (args, tuple(sorted(kwargs.items())))
+        return await self.cache.fetch(name, key, lambda: method(self, *args, **kwargs))
+
+    return wrapper
+
+
+def _invalidates(*names: str):
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                return await method(self, *args, **kwargs)
+            finally:
+                # Also on failure: the core may have applied the change
+                # before the error or timeout reached us.
+                if self.cache is not None:
+                    self.cache.invalidate(*names)
+
+        return wrapper
+
+    return decorator
+
+
+class GuardCoreClient:
+    """Guard core client bound to one base URL and one set of credentials.
+
+    Each client owns its pooled session unless an existing ``core`` is
+    shared with it, so several clients can run side by side.
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        api_key: str | None = None,
+        access_token: str | None = None,
+        core: RequestCore | None = None,
+        cache: ResponseCache | bool | None = None,
+        auth: TokenProvider | None = None,
+        **options,
+    ) -> None:
+        if core is not None and (base_url is not None or options):
+            raise ValueError("base_url and session options cannot be used with core")
+        if auth is not None and access_token is not None:
+            raise ValueError("access_token cannot be used with auth")
+        self.core = core if core is not None else RequestCore(base_url, **options)
+        self._owns_core = core is None
+        self._headers = RequestCore.generate_headers(api_key, access_token)
+        self.cache = ResponseCache() if cache is True else cache or None
+        self.auth = auth
+        self._token_headers: tuple[str, dict] | None = None
+
+    async def __aenter__(self) -> "GuardCoreClient":
+        await self.startup()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.shutdown()
+
+    async def startup(self) -> None:
+        await self.core.get_session()
+
+    async def shutdown(self) -> None:
+        if self._owns_core:
+            await self.core.shutdown()
+
+    def stats(self) -> dict:
+        """Snapshot the counters of every enabled client component."""
+        components = {
+            "requests": self.core.metrics,
+            "cache": self.cache,
+            "coalesce": self.core.singleflight,
+            "hedge": self.core.hedge,
+            "retry": self.core.retry,
+            "breaker": self.core.breaker,
+            "limiter": self.core.limiter,
+        }
+        return {
+            name: component.stats()
+            for name, component in components.items()
+            if component is not None
+        }
+
+    def _headers_for(self, token: str) -> dict:
+        if self._token_headers is None or self._token_headers[0] != token:
+            headers = {**self._headers, "Authorization": f"Bearer {token}"}
+            self._token_headers = (token, headers)
+        return self._token_headers[1]
+
+    async def _fetch(
+        self,
+        method: str,
+        route: str,
+        authenticated: bool = True,
+        path: dict | None = None,
+        **kwargs,
+    ):
+        endpoint = route.format_map(path) if path else route
+        kwargs["route"] = route
+        if self.auth is None or not authenticated:
+            return await self.core.fetch(
+                endpoint,
+                method=method,
+                headers=self._headers if authenticated else None,
+                **kwargs,
+            )
+        token = await self.auth.token(self)
+        try:
+            return await self.core.fetch(
+                endpoint, method=method, headers=self._headers_for(token), **kwargs
+            )
+        except RequestAuthenticationError:
+            token = await self.auth.refresh(self, token)
+        return await self.core.fetch(
+            endpoint, method=method, headers=self._headers_for(token), **kwargs
+        )
+
+    def _stream(
+        self,
+        route: str,
+        authenticated: bool = True,
+        path: dict | None = None,
+        **kwargs,
+    ) -> AsyncIterator:
+        endpoint = route.format_map(path) if path else route
+        kwargs["route"] = route
+        if self.auth is None or not authenticated:
+            return self.core.stream(
+                endpoint,
+                headers=self._headers if authenticated else None,
+                **kwargs,
+            )
+        return self._authenticated_stream(endpoint, **kwargs)
+
+    async def _authenticated_stream(self, endpoint: str, **kwargs) -> AsyncIterator:
+        token = await self.auth.token(self)
+        started = False
+        try:
+            async for item in self.core.stream(
+                endpoint, headers=self._headers_for(token), **kwargs
+            ):
+                started = True
+                yield item
+            return
+        except RequestAuthenticationError:
+            if started:
+                raise
+            token = await self.auth.refresh(self, token)
+        async for item in self.core.stream(
+            endpoint, headers=self._headers_for(token), **kwargs
+        ):
+            yield item
+
+    async def get_all_admin(
+        self, validate: ValidationMode | None = None
+    ) -> list[AdminResponse]:
+        return await self._fetch(
+            "GET",
+            "/api/admins",
+            response_model=AdminResponse,
+            use_list=True,
+            validate=validate,
+        )
+
+    def stream_all_admin(
+        self, validate: ValidationMode | None = None
+    ) -> AsyncIterator[AdminResponse]:
+        return self._stream(
+            "/api/admins",
+            response_model=AdminResponse,
+            validate=validate,
+        )
+
+    async def create_admin(self, data: AdminCreate) -> AdminResponse:
+        return await self._fetch(
+            "POST",
+            "/api/admins",
+            json=data.dict(),
+            response_model=AdminResponse,
+        )
+
+    async def generate_admin_token(
+        self,
+        username: str,
+        password: str,
+        totp_code: str | None = None,
+        validate: ValidationMode | None = None,
+    ) -> AdminToken:
+        params = {}
+        if totp_code:
+            params["totp_code"] = totp_code
+        return await self._fetch(
+            "POST",
+            "/api/admins/token",
+            params=params,
+            data={
+                "username": username,
+                "password": password,
+            },
+            response_model=AdminToken,
+            validate=validate,
+            authenticated=False,
+        )
+
+    @_cached
+    async def get_current_admin(self) -> AdminResponse:
+        return await self._fetch(
+            "GET",
+            "/api/admins/current",
+            response_model=AdminResponse,
+        )
+
+    @_invalidates(*_CURRENT_ADMIN)
+    async def update_current_admin(
+        self, data: AdminCurrentUpdate, code: str | None = None
+    ) -> AdminResponse:
+        return await self._fetch(
+            "PUT",
+            "/api/admins/current",
+            json={"data": data.dict(), "code": code},
+            response_model=AdminResponse,
+        )
+
+    async def get_current_admin_usages(self) -> AdminUsageLogsResponse:
+        return await self._fetch(
+            "GET",
+            "/api/admins/current/usages",
+            response_model=AdminUsageLogsResponse,
+        )
+
+    @_invalidates(*_CURRENT_ADMIN)
+    async def revoke_current_admin_api_key(self) -> AdminResponse:
+        return await self._fetch(
+            "POST",
+            "/api/admins/current/revoke",
+            response_model=AdminResponse,
+        )
+
+    @_invalidates(*_CURRENT_ADMIN)
+    async def revoke_totp_secret(self, code: str | None = None) -> dict:
+        return await self._fetch(
+            "POST",
+            "/api/admins/current/totp/revoke",
+            json={"code": code},
+        )
+
+    @_invalidates(*_CURRENT_ADMIN)
+    async def verify_totp_secret(self, code: str) -> dict:
+        return await self._fetch(
+            "POST",
+            "/api/admins/current/totp/verify",
+            json={"code": code},
+        )
+
+    async def get_current_admin_backup(self) -> dict:
+        return await self._fetch(
+            "GET",
+            "/api/admins/current/backup",
+        )
+
+    async def get_admin(self, username: str) -> AdminResponse:
+        return await self._fetch(
+            "GET",
+            "/api/admins/{username}",
+            path={"username": username},
+            response_model=AdminResponse,
+        )
+
+    async def update_admin(self, username: str, data: AdminUpdate) -> AdminResponse:
+        return await self._fetch(
+            "PUT",
+            "/api/admins/{username}",
+            path={"username": username},
+            json=data.dict(),
+            response_model=AdminResponse,
+        )
+
+    async def delete_admin(self, username: str) -> dict:
+        return await self._fetch(
+            "DELETE",
+            "/api/admins/{username}",
+            path={"username": username},
+        )
+
+    async def get_admin_usages(self, username: str) -> AdminUsageLogsResponse:
+        return await self._fetch(
+            "GET",
+            "/api/admins/{username}/usages",
+            path={"username": username},
+            response_model=AdminUsageLogsResponse,
+        )
+
+    async def enable_admin(self, username: str) -> AdminResponse:
+        return await self._fetch(
+            "POST",
+            "/api/admins/{username}/enable",
+            path={"username": username},
+            response_model=AdminResponse,
+            idempotent=True,
+        )
+
+    async def disable_admin(self, username: str) -> AdminResponse:
+        return await self._fetch(
+            "POST",
+            "/api/admins/{username}/disable",
+            path={"username": username},
+            response_model=AdminResponse,
+            idempotent=True,
+        )
+
+    async def revoke_admin_api_key(self, username: str) -> AdminResponse:
+        return await self._fetch(
+            "POST",
+            "/api/admins/{username}/revoke",
+            path={"username": username},
+            response_model=AdminResponse,
+        )
+
+    async def get_admin_subscriptions(
+        self, username: str, validate: ValidationMode | None = None
+    ) -> list[SubscriptionResponse]:
+        return await self._fetch(
+            "GET",
+            "/api/admins/{username}/subscriptions",
+            path={"username": username},
+            response_model=SubscriptionResponse,
+            use_list=True,
+            validate=validate,
+        )
+
+    def stream_admin_subscriptions(
+        self, username: str, validate: ValidationMode | None = None
+    ) -> AsyncIterator[SubscriptionResponse]:
+        return self._stream(
+            "/api/admins/{username}/subscriptions",
+            path={"username": username},
+            response_model=SubscriptionResponse,
+            validate=validate,
+        )
+
+    async def revoke_admin(self, username: str) -> dict:
+        return await self._fetch(
+            "POST",
+            "/api/admins/{username}/revoke",
+            path={"username": username},
+        )
+
+    @_invalidates(*_CURRENT_ADMIN, *_SERVICES, *_SUBSCRIPTION_STATS)
+    async def delete_admin_subscriptions(self, username: str) -> dict:
+        return await self._fetch(
+            "DELETE",
+            "/api/admins/{username}/subscriptions",
+            path={"username": username},
+        )
+
+    @_invalidates(*_SUBSCRIPTION_STATS)
+    async def activate_admin_subscriptions(self, username: str) -> dict:
+        return await self._fetch(
+            "POST",
+            "/api/admins/{username}/subscriptions/activate",
+            path={"username": username},
+        )
+
+    @_invalidates(*_SUBSCRIPTION_STATS)
+    async def deactivate_admin_subscriptions(self, username: str) -> dict:
+        return await self._fetch(
+            "POST",
+            "/api/admins/{username}/subscriptions/deactivate",
+            path={"username": username},
+        )
+
+    async def get_all_subscriptions(
+        self,
+        limited: bool | None = None,
+        expired: bool | None = None,
+        is_active: bool | None = None,
+        enabled: bool | None = None,
+        search: str | None = None,
+        online: bool | None = None,
+        order_by: str | None = None,
+        page: int | None = 1,
+        size: int | None = 10,
+        validate: ValidationMode | None = None,
+    ) -> list[SubscriptionResponse]:
+        params = _filter_params(
+            limited=limited,
+            expired=expired,
+            is_active=is_active,
+            enabled=enabled,
+            search=search,
+            online=online,
+            order_by=order_by,
+            page=page,
+            size=size,
+        )
+
+        return await self._fetch(
+            "GET",
+            "/api/subscriptions",
+            params=params,
+            response_model=SubscriptionResponse,
+            use_list=True,
+            validate=validate,
+        )
+
+    def stream_all_subscriptions(
+        self,
+        limited: bool | None = None,
+        expired: bool | None = None,
+        is_active: bool | None = None,
+        enabled: bool | None = None,
+        search: str | None = None,
+        online: bool | None = None,
+        order_by: str | None = None,
+        page: int | None = 1,
+        size: int | None = 10,
+        validate: ValidationMode | None = None,
+    ) -> AsyncIterator[SubscriptionResponse]:
+        params = _filter_params(
+            limited=limited,
+            expired=expired,
+            is_active=is_active,
+            enabled=enabled,
+            search=search,
+            online=online,
+            order_by=order_by,
+            page=page,
+            size=size,
+        )
+        return self._stream(
+            "/api/subscriptions",
+            params=params,
+            response_model=SubscriptionResponse,
+            validate=validate,
+        )
+
+    async def iter_subscriptions(
+        self,
+        limited: bool | None = None,
+        expired: bool | None = None,
+        is_active: bool | None = None,
+        enabled: bool | None = None,
+        search: str | None = None,
+        online: bool | None = None,
+        order_by: str | None = None,
+        size: int = 100,
+        prefetch: int = 2,
+        validate: ValidationMode | None = None,
+    ) -> AsyncIterator[SubscriptionResponse]:
+        """Yield every subscription matching the filters, page by page.
+
+        Up to ``prefetch`` pages are requested ahead of the one being consumed,
+        so at most ``prefetch + 1`` pages are held in memory at a time.
+        """
+        pages: deque[asyncio.Task] = deque()
+        next_page = 1
+        full_page = 0
+
+        def schedule() -> None:
+            nonlocal next_page
+            pages.append(
+                asyncio.ensure_future(
+                    self.get_all_subscriptions(
+                        limited=limited,
+                        expired=expired,
+                        is_active=is_active,
+                        enabled=enabled,
+                        search=search,
+                        online=online,
+                        order_by=order_by,
+                        page=next_page,
+                        size=size,
+                        validate=validate,
+                    )
+                )
+            )
+            next_page += 1
+
+        try:
+            for _ in range(prefetch + 1):
+                schedule()
+            while pages:
+                subscriptions = await pages.popleft()
+                # The core may cap ``size``, so a page shorter than the
+                # largest one seen so far marks the end of the listing.
+                full_page = max(full_page, len(subscriptions))
+                exhausted = len(subscriptions) < full_page or not subscriptions
+                if not exhausted:
+                    schedule()
+                for subscription in subscriptions:
+                    yield subscription
+                if exhausted:
+                    break
+        finally:
+            for task in pages:
+                task.cancel()
+            await asyncio.gather(*pages, return_exceptions=True)
+
+    async def fetch_all_subscriptions(
+        self,
+        limited: bool | None = None,
+        expired: bool | None = None,
+        is_active: bool | None = None,
+        enabled: bool | None = None,
+        online: bool | None = None,
+        order_by: str | None = None,
+        size: int = 100,
+        concurrency: int = 8,
+        validate: ValidationMode | None = None,
+    ) -> list[SubscriptionResponse]:
+        """Fetch every subscription matching the filters with concurrent pages.
+
+        The page count comes from ``get_subscription_count``. Pages past that
+        count are still read until one comes back short, and rows that shift
+        between pages are deduplicated by ``id``, keeping page order.
+        """
+        total = await self.get_subscription_count(
+            limited=limited,
+            expired=expired,
+            is_active=is_active,
+            enabled=enabled,
+            online=online,
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_page(page: int) -> list[SubscriptionResponse]:
+            async with semaphore:
+                return await self.get_all_subscriptions(
+                    limited=limited,
+                    expired=expired,
+                    is_active=is_active,
+                    enabled=enabled,
+                    online=online,
+                    order_by=order_by,
+                    page=page,
+                    size=size,
+                    validate=validate,
+                )
+
+        async with asyncio.TaskGroup() as group:
+            tasks = [
+                group.create_task(fetch_page(page))
+                for page in range(1, -(-total // size) + 1)
+            ]
+        pages = [task.result() for task in tasks]
+
+        full_page = max(map(len, pages), default=0)
+        while not pages or (pages[-1] and len(pages[-1]) >= full_page):
+            pages.append(await fetch_page(len(pages) + 1))
+            full_page = max(full_page, len(pages[-1]))
+
+        seen: set[int] = set()
+        subscriptions = []
+        for page in pages:
+            for subscription in page:
+                key = (
+                    subscription["id"]
+                    if isinstance(subscription, dict)
+                    else subscription.id
+                )
+                if key not in seen:
+                    seen.add(key)
+                    subscriptions.append(subscription)
+        return subscriptions
+
+    @_invalidates(*_CURRENT_ADMIN, *_SERVICES, *_SUBSCRIPTION_STATS)
+    async def create_subscription(
+        self, data: list[SubscriptionCreate]
+    ) -> SubscriptionResponse:
+        return await self._fetch(
+            "POST",
+            "/api/subscriptions",
+            json=[item.dict() for item in data],
+            response_model=SubscriptionResponse,
+            use_list=True,
+        )
+
+    def import_subscriptions(
+        self,
+        data: Iterable[SubscriptionCreate],
+        chunk_size: int = 100,
+        concurrency: int = 4,
+        skip: Iterable[str] = (),
+    ) -> AsyncIterator[BulkItemResult]:
+        """Create subscriptions in chunks, yielding one result per item.
+
+        Up to ``concurrency`` chunks of ``chunk_size`` rows are sent at once
+        and results are yielded as chunks finish. A chunk the core rejects
+        with 400, 409 or 422 is retried row by row, so one bad row only
+        fails itself; other errors (429, 5xx, timeouts) fail the whole
+        chunk. Usernames in ``skip`` (e.g. the successes of an interrupted
+        run) are not sent.
+        """
+        return import_subscriptions(self, data, chunk_size, concurrency, skip)
+
+    async def bulk_apply(
+        self,
+        op: str | Callable[..., Awaitable[Any]],
+        usernames: Iterable[str],
+        concurrency: int = 16,
+        on_progress: Callable[[BulkItemResult, int, int], None] | None = None,
+        **kwargs,
+    ) -> BulkReport:
+        """Run a per-username operation over many usernames.
+
+        ``op`` is a client method name such as ``"enable_subscription"`` or
+        any coroutine function taking the username first; ``kwargs`` are
+        passed to every call. ``concurrency`` workers share the usernames
+        and ``on_progress(result, done, total)`` is called after each one.
+        Cancelling the call cancels the requests still in flight.
+        """
+        return await bulk_apply(self, op, usernames, concurrency, on_progress, **kwargs)
+
+    async def get_subscription_count(
+        self,
+        limited: bool | None = None,
+        expired: bool | None = None,
+        is_active: bool | None = None,
+        enabled: bool | None = None,
+        online: bool | None = None,
+    ) -> int:
+        params = _filter_params(
+            limited=limited,
+            expired=expired,
+            is_active=is_active,
+            enabled=enabled,
+            online=online,
+        )
+
+        return await self._fetch(
+            "GET",
+            "/api/subscriptions/count",
+            params=params,
+        )
+
+    @_cached
+    async def get_subscription_stats(self) -> SubscriptionStatsResponse:
+        return await self._fetch(
+            "GET",
+            "/api/subscriptions/stats",
+            response_model=SubscriptionStatsResponse,
+        )
+
+    async def get_subscription(
+        self, username: str, validate: ValidationMode | None = None
+    ) -> SubscriptionResponse:
+        return await self._fetch(
+            "GET",
+            "/api/subscriptions/{username}",
+            path={"username": username},
+            response_model=SubscriptionResponse,
+            validate=validate,
+        )
+
+    @_invalidates(*_SERVICES, *_SUBSCRIPTION_STATS)
+    async def update_subscription(
+        self, username: str, data: SubscriptionUpdate
+    ) -> SubscriptionResponse:
+        return await self._fetch(
+            "PUT",
+            "/api/subscriptions/{username}",
+            path={"username": username},
+            json=data.dict(),
+            response_model=SubscriptionResponse,
+        )
+
+    @_invalidates(*_CURRENT_ADMIN, *_SERVICES, *_SUBSCRIPTION_STATS)
+    async def delete_subscription(self, username: str) -> dict:
+        return await self._fetch(
+            "DELETE",
+            "/api/subscriptions/{username}",
+            path={"username": username},
+        )
+
+    async def get_subscription_usages(
+        self, username: str
+    ) -> SubscriptionUsageLogsResponse:
+        return await self._fetch(
+            "GET",
+            "/api/subscriptions/{username}/usages",
+            path={"username": username},
+            response_model=SubscriptionUsageLogsResponse,
+        )
+
+    @_invalidates(*_SUBSCRIPTION_STATS)
+    async def enable_subscription(self, username: str) -> SubscriptionResponse:
+        return await self._fetch(
+            "POST",
+            "/api/subscriptions/{username}/enable",
+            path={"username": username},
+            response_model=SubscriptionResponse,
+            idempotent=True,
+        )
+
+    @_invalidates(*_SUBSCRIPTION_STATS)
+    async def disable_subscription(self, username: str) -> SubscriptionResponse:
+        return await self._fetch(
+            "POST",
+            "/api/subscriptions/{username}/disable",
+            path={"username": username},
+            response_model=SubscriptionResponse,
+            idempotent=True,
+        )
+
+    @_invalidates(*_SUBSCRIPTION_STATS)
+    async def revoke_subscription(self, username: str) -> SubscriptionResponse:
+        return await self._fetch(
+            "POST",
+            "/api/subscriptions/{username}/revoke",
+            path={"username": username},
+            response_model=SubscriptionResponse,
+        )
+
+    @_invalidates(*_CURRENT_ADMIN, *_SUBSCRIPTION_STATS)
+    async def reset_subscription(self, username: str) -> SubscriptionResponse:
+        return await self._fetch(
+            "POST",
+            "/api/subscriptions/{username}/reset",
+            path={"username": username},
+            response_model=SubscriptionResponse,
+        )
+
+    @_invalidates(*_SERVICES)
+    async def bulk_add_service(self, service_id: int) -> dict:
+        return await self._fetch(
+            "POST",
+            "/api/subscriptions/services/{service_id}",
+            path={"service_id": service_id},
+        )
+
+    @_invalidates(*_SERVICES)
+    async def bulk_remove_service(self, service_id: int) -> dict:
+        return await self._fetch(
+            "DELETE",
+            "/api/subscriptions/services/{service_id}",
+            path={"service_id": service_id},
+        )
+
+    @_cached
+    async def get_nodes(
+        self, validate: ValidationMode | None = None
+    ) -> list[NodeResponse]:
+        return await self._fetch(
+            "GET",
+            "/api/nodes",
+            response_model=NodeResponse,
+            use_list=True,
+            validate=validate,
+        )
+
+    @_invalidates(*_NODES)
+    async def create_node(self, data: NodeCreate) -> NodeResponse:
+        return await self._fetch(
+            "POST",
+            "/api/nodes",
+            json=data.dict(),
+            response_model=NodeResponse,
+        )
+
+    @_cached
+    async def get_node_stats(self) -> NodeStatsResponse:
+        return await self._fetch(
+            "GET",
+            "/api/nodes/stats",
+            response_model=NodeStatsResponse,
+        )
+
+    @_cached
+    async def get_node(self, node_id: int) -> NodeResponse:
+        return await self._fetch(
+            "GET",
+            "/api/nodes/{node_id}",
+            path={"node_id": node_id},
+            response_model=NodeResponse,
+        )
+
+    @_invalidates(*_NODES)
+    async def update_node(self, node_id: int, data: NodeUpdate) -> NodeResponse:
+        return await self._fetch(
+            "PUT",
+            "/api/nodes/{node_id}",
+            path={"node_id": node_id},
+            json=data.dict(),
+            response_model=NodeResponse,
+        )
+
+    @_invalidates(*_NODES, *_SERVICES)
+    async def delete_node(self, node_id: int) -> dict:
+        return await self._fetch(
+            "DELETE",
+            "/api/nodes/{node_id}",
+            path={"node_id": node_id},
+        )
+
+    @_invalidates(*_NODES)
+    async def enable_node(self, node_id: int) -> NodeResponse:
+        return await self._fetch(
+            "POST",
+            "/api/nodes/{node_id}/enable",
+            path={"node_id": node_id},
+            response_model=NodeResponse,
+            idempotent=True,
+        )
+
+    @_invalidates(*_NODES)
+    async def disable_node(self, node_id: int) -> NodeResponse:
+        return await self._fetch(
+            "POST",
+            "/api/nodes/{node_id}/disable",
+            path={"node_id": node_id},
+            response_model=NodeResponse,
+            idempotent=True,
+        )
+
+    @_cached
+    async def get_services(
+        self, validate: ValidationMode | None = None
+    ) -> list[ServiceResponse]:
+        return await self._fetch(
+            "GET",
+            "/api/services",
+            response_model=ServiceResponse,
+            use_list=True,
+            validate=validate,
+        )
+
+    @_invalidates(*_SERVICES)
+    async def create_service(self, data: ServiceCreate) -> ServiceResponse:
+        return await self._fetch(
+            "POST",
+            "/api/services",
+            json=data.dict(),
+            response_model=ServiceResponse,
+        )
+
+    @_cached
+    async def get_service(self, service_id: int) -> ServiceResponse:
+        return await self._fetch(
+            "GET",
+            "/api/services/{service_id}",
+            path={"service_id": service_id},
+            response_model=ServiceResponse,
+        )
+
+    @_invalidates(*_SERVICES)
+    async def update_service(
+        self, service_id: int, data: ServiceUpdate
+    ) -> ServiceResponse:
+        return await self._fetch(
+            "PUT",
+            "/api/services/{service_id}",
+            path={"service_id": service_id},
+            json=data.dict(),
+            response_model=ServiceResponse,
+        )
+
+    @_invalidates(*_SERVICES)
+    async def delete_service(self, service_id: int) -> dict:
+        return await self._fetch(
+            "DELETE",
+            "/api/services/{service_id}",
+            path={"service_id": service_id},
+        )
+
+    async def get_guard(self, secret: str) -> list[str]:
+        return await self._fetch(
+            "GET",
+            "/guards/{secret}",
+            path={"secret": secret},
+            authenticated=False,
+        )
+
+    async def get_guard_info(self, secret: str) -> SubscriptionResponse:
+        return await self._fetch(
+            "GET",
+            "/guards/{secret}/info",
+            path={"secret": secret},
+            authenticated=False,
+        )
+
+    async def get_guard_usage_logs(self, secret: str) -> SubscriptionUsageLogsResponse:
+        return await self._fetch(
+            "GET",
+            "/guards/{secret}/usages",
+            path={"secret": secret},
+            response_model=SubscriptionUsageLogsResponse,
+            authenticated=False,
+        )
+
+    async def get_subscription_status_stats(self) -> SubscriptionStatusStatsResponse:
+        return await self._fetch(
+            "GET",
+            "/api/stats/subscriptions/status",
+            response_model=SubscriptionStatusStatsResponse,
+        )
+
+    async def get_most_usage_subscriptions(
+        self, start_date: str, end_date: str
+    ) -> MostUsageSubscription:
+        return await self._fetch(
+            "GET",
+            "/api/stats/subscriptions/most_usage",
+            params={"start_date": start_date, "end_date": end_date},
+            response_model=MostUsageSubscription,
+        )
+
+    async def get_usage_stats(
+        self, start_date: str, end_date: str
+    ) -> UsageStatsResponse:
+        return await self._fetch(
+            "GET",
+            "/api/stats/usage",
+            params={"start_date": start_date, "end_date": end_date},
+            response_model=UsageStatsResponse,
+        )
+
+    async def get_agent_stats(self) -> AgentStatsResponse:
+        return await self._fetch(
+            "GET",
+            "/api/stats/agents",
+            response_model=AgentStatsResponse,
+        )
+
+    async def get_last_reached_subscriptions(
+        self,
+        page: int = 1,
+        size: int = 20,
+        start_date: str | None = None,
+        end_date: str | None = None,
+    ) -> list[LastReachedSubscriptionDetail]:
+        params = {"page": page, "size": size}
+        if start_date:
+            params["start_date"] = start_date
+        if end_date:
+            params["end_date"] = end_date
+        return await self._fetch(
+            "GET",
+            "/api/stats/subscriptions/reacheds",
+            params=params,
+            response_model=LastReachedSubscriptionDetail,
+            use_list=True,
+        )
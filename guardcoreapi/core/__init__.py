@@ -1,17 +1,96 @@
-from .request import RequestCore
-from .exceptions import (
-    GuardCoreApiException,
-    RequestAuthenticationError,
-    RequestConnectionError,
-    RequestResponseError,
-    RequestTimeoutError,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .request import RequestCore
+    from .validation import LazyModel, ValidationMode
+    from .cache import ResponseCache, TTLCache
+    from .coalesce import SingleFlight
+    from .breaker import CircuitBreaker
+    from .hedge import HedgePolicy
+    from .retry import RetryPolicy
+    from .limiter import RequestLimiter, TokenBucket
+    from .lag import LoopLagMonitor
+    from .metrics import Histogram, RequestMetrics
+    from .tracing import RequestTrace
+    from .codec import JSONCodec, OrjsonCodec, MsgspecCodec, default_codec
+    from .exceptions import (
+        CircuitOpenError,
+        GuardCoreApiException,
+        RequestAuthenticationError,
+        RequestConnectionError,
+        RequestResponseError,
+        RequestThrottledError,
+        RequestTimeoutError,
+    )
+
+_LAZY = {
+    "RequestCore": ".request",
+    "ResponseCache": ".cache",
+    "TTLCache": ".cache",
+    "SingleFlight": ".coalesce",
+    "HedgePolicy": ".hedge",
+    "RetryPolicy": ".retry",
+    "CircuitBreaker": ".breaker",
+    "JSONCodec": ".codec",
+    "OrjsonCodec": ".codec",
+    "MsgspecCodec": ".codec",
+    "default_codec": ".codec",
+    "LazyModel": ".validation",
+    "ValidationMode": ".validation",
+    "CircuitOpenError": ".exceptions",
+    "GuardCoreApiException": ".exceptions",
+    "RequestAuthenticationError": ".exceptions",
+    "RequestConnectionError": ".exceptions",
+    "RequestResponseError": ".exceptions",
+    "RequestThrottledError": ".exceptions",
+    "RequestTimeoutError": ".exceptions",
+    "RequestLimiter": ".limiter",
+    "RequestTrace": ".tracing",
+    "RequestMetrics": ".metrics",
+    "Histogram": ".metrics",
+    "LoopLagMonitor": ".lag",
+    "TokenBucket": ".limiter",
+}
 
 __all__ = [
     "RequestCore",
+    "ResponseCache",
+    "TTLCache",
+    "SingleFlight",
+    "HedgePolicy",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "JSONCodec",
+    "OrjsonCodec",
+    "MsgspecCodec",
+    "default_codec",
+    "LazyModel",
+    "ValidationMode",
+    "CircuitOpenError",
     "GuardCoreApiException",
     "RequestAuthenticationError",
     "RequestConnectionError",
     "RequestResponseError",
+    "RequestThrottledError",
     "RequestTimeoutError",
+    "RequestLimiter",
+    "RequestTrace",
+    "RequestMetrics",
+    "Histogram",
+    "LoopLagMonitor",
+    "TokenBucket",
 ]
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,169 @@
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from .exceptions import (
+    CircuitOpenError,
+    GuardCoreApiException,
+    RequestConnectionError,
+    RequestTimeoutError,
+)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def endpoint_group(endpoint: str, depth: int = 2) -> str:
+    """Return the leading path segments, e.g. ``/api/subscriptions``.
+
+    Segments from the first ``{placeholder}`` on are dropped, so a route
+    template such as ``/guards/{secret}/info`` gives ``/guards`` and
+    requests for different secrets share one group.
+    """
+    segments = []
+    for segment in endpoint.split("?", 1)[0].strip("/").split("/")[:depth]:
+        if segment.startswith("{"):
+            break
+        segments.append(segment)
+    return "/" + "/".join(segments)
+
+
+class _Circuit:
+    __slots__ = ("state", "outcomes", "failures", "opened_at", "probing", "opens")
+
+    def __init__(self, window: int) -> None:
+        self.state = CLOSED
+        self.outcomes: deque[bool] = deque(maxlen=window)
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = 0
+        self.opens = 0
+
+
+class CircuitBreaker:
+    """Fail fast on endpoint groups whose recent requests mostly failed.
+
+    Each group keeps the outcome of its last ``window`` requests; once at
+    least ``min_requests`` are known and ``failure_rate`` of them were
+    connection errors, timeouts or 5xx responses, the circuit opens and
+    calls raise ``CircuitOpenError`` without a request. After ``open_for``
+    seconds up to ``probes`` concurrent requests are let through
+    (half-open): a success closes the circuit, a failure opens it again.
+
+    ``RequestCore`` passes the route template (``/guards/{secret}``) rather
+    than the concrete path, so the number of circuits stays bounded.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        min_requests: int = 20,
+        window: int = 100,
+        open_for: float = 10.0,
+        probes: int = 1,
+        depth: int = 2,
+    ) -> None:
+        self.failure_rate = failure_rate
+        self.min_requests = min_requests
+        self.window = window
+        self.open_for = open_for
+        self.probes = probes
+        self.depth = depth
+        self.rejected = 0
+        self._circuits: dict[str, _Circuit] = {}
+
+    @staticmethod
+    def is_failure(error: BaseException) -> bool:
+        if isinstance(error, (RequestConnectionError, RequestTimeoutError)):
+            return True
+        return (
+            isinstance(error, GuardCoreApiException)
+            and error.status is not None
+            and error.status >= 500
+        )
+
+    def state(self, endpoint: str) -> str:
+        circuit = self._circuits.get(endpoint_group(endpoint, self.depth))
+        return CLOSED if circuit is None else circuit.state
+
+    async def call(self, endpoint: str, send: Callable[[], Awaitable[Any]]) -> Any:
+        async with self.guard(endpoint):
+            return await send()
+
+    @asynccontextmanager
+    async def guard(self, endpoint: str) -> AsyncIterator[None]:
+        """Admit one request, e.g. a stream, and record how its body ends."""
+        group = endpoint_group(endpoint, self.depth)
+        circuit = self._circuits.get(group)
+        if circuit is None:
+            circuit = self._circuits[group] = _Circuit(self.window)
+        probe = self._admit(group, circuit)
+        try:
+            yield
+        except BaseException as error:
+            if probe:
+                circuit.probing -= 1
+            if isinstance(error, Exception):
+                self._record(circuit, self.is_failure(error), probe)
+            raise
+        if probe:
+            circuit.probing -= 1
+        self._record(circuit, False, probe)
+
+    def _admit(self, group: str, circuit: _Circuit) -> bool:
+        if circuit.state == CLOSED:
+            return False
+        remaining = circuit.opened_at + self.open_for - time.monotonic()
+        if remaining <= 0 and circuit.probing < self.probes:
+            circuit.state = HALF_OPEN
+            circuit.probing += 1
+            return True
+        self.rejected += 1
+        raise CircuitOpenError(
+            f"Circuit open for {group}", retry_after=max(0.0, remaining)
+        )
+
+    def _record(self, circuit: _Circuit, failed: bool, probe: bool) -> None:
+        if circuit.state != CLOSED:
+            if not probe:
+                return
+            if failed:
+                self._open(circuit)
+            else:
+                circuit.state = CLOSED
+                circuit.outcomes.clear()
+                circuit.failures = 0
+            return
+        if len(circuit.outcomes) == circuit.outcomes.maxlen:
+            circuit.failures -= circuit.outcomes[0]
+        circuit.outcomes.append(failed)
+        circuit.failures += failed
+        if len(
+            circuit.outcomes
+        ) >= self.min_requests and circuit.failures >= self.failure_rate * len(
+            circuit.outcomes
+        ):
+            self._open(circuit)
+
+    @staticmethod
+    def _open(circuit: _Circuit) -> None:
+        circuit.state = OPEN
+        circuit.opened_at = time.monotonic()
+        circuit.opens += 1
+
+    def stats(self) -> dict:
+        return {
+            "rejected": self.rejected,
+            "groups": {
+                group: {
+                    "state": circuit.state,
+                    "requests": len(circuit.outcomes),
+                    "failures": circuit.failures,
+                    "opens": circuit.opens,
+                }
+                for group, circuit in self._circuits.items()
+            },
+        }
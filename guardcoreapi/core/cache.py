@@ -0,0 +1,124 @@
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Optional
+
+MISSING = object()
+
+
+class TTLCache:
+    """Bounded LRU mapping whose entries expire after a per-entry TTL."""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def discard_if(self, predicate: Callable[[Hashable], bool]) -> None:
+        for key in [key for key in self._entries if predicate(key)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class ResponseCache:
+    """Per-client cache for rarely changing read endpoints.
+
+    ``ttl`` maps client method names to seconds and is merged over
+    ``DEFAULT_TTLS``; a TTL of ``0`` disables caching for that method.
+    Entries are dropped when a mutation touching them runs through the same
+    client, and results fetched while such a mutation ran are not stored.
+    """
+
+    DEFAULT_TTLS = {
+        "get_current_admin": 30.0,
+        "get_nodes": 30.0,
+        "get_node": 30.0,
+        "get_node_stats": 30.0,
+        "get_services": 60.0,
+        "get_service": 60.0,
+        "get_subscription_stats": 15.0,
+    }
+
+    def __init__(
+        self, ttl: Optional[dict[str, float]] = None, maxsize: int = 1024
+    ) -> None:
+        self.ttl = {**self.DEFAULT_TTLS, **(ttl or {})}
+        self._store = TTLCache(maxsize)
+        self._generations: dict[str, int] = {}
+        self._counters: dict[str, list[int]] = {}
+
+    async def fetch(
+        self,
+        name: str,
+        key: Hashable,
+        factory: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        ttl = self.ttl.get(name)
+        if not ttl:
+            return await factory()
+        counters = self._counters.setdefault(name, [0, 0])
+        value = self._store.get((name, key))
+        if value is not MISSING:
+            counters[0] += 1
+            return value
+        counters[1] += 1
+        generation = self._generations.get(name, 0)
+        value = await factory()
+        if self._generations.get(name, 0) == generation:
+            self._store.set((name, key), value, ttl)
+        return value
+
+    def invalidate(self, *names: str) -> None:
+        for name in names:
+            self._generations[name] = self._generations.get(name, 0) + 1
+        self._store.discard_if(lambda key: key[0] in names)
+
+    def clear(self) -> None:
+        self._store.clear()
+
+    def stats(self) -> dict:
+        return {
+            **self._store.stats(),
+            "endpoints": {
+                name: {"hits": hits, "misses": misses}
+                for name, (hits, misses) in self._counters.items()
+            },
+        }
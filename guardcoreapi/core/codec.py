@@ -0,0 +1,56 @@
+import json
+from typing import Any
+
+
+class JSONCodec:
+    """Standard library codec and the interface other codecs implement."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self._loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self._decoder.decode(data)
+
+
+def default_codec() -> JSONCodec:
+    """Return the fastest installed codec, falling back to the stdlib."""
+    for codec in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec()
+        except ImportError:
+            continue
+    return JSONCodec()
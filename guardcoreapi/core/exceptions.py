@@ -1,7 +1,19 @@
+from typing import Optional
+
+
 class GuardCoreApiException(Exception):
     """Base class for request errors."""
 
-    pass
+    def __init__(
+        self,
+        message: str = "",
+        status: Optional[int] = None,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+        self.attempts = 1
 
 
 class RequestTimeoutError(GuardCoreApiException):
@@ -26,3 +38,15 @@ class RequestAuthenticationError(GuardCoreApiException):
     """Exception raised for authentication failures."""
 
     pass
+
+
+class RequestThrottledError(GuardCoreApiException):
+    """Exception raised when a caller exceeds its request rate."""
+
+    pass
+
+
+class CircuitOpenError(GuardCoreApiException):
+    """Exception raised when requests to an unhealthy endpoint group are shed."""
+
+    pass
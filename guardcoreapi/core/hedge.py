@@ -0,0 +1,109 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from .exceptions import RequestResponseError
+
+
+class HedgePolicy:
+    """Send a second copy of a GET that is slower than usual.
+
+    The hedge delay is the ``percentile`` of the last ``window`` observed
+    latencies, clamped to ``[min_delay, max_delay]``; ``max_delay`` is used
+    until ``min_samples`` latencies are known. Each request earns
+    ``max_rate`` hedge credits (at most ``burst``) and each hedge spends one,
+    so hedges stay below ``max_rate`` of all requests sharing the policy.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        min_delay: float = 0.01,
+        max_delay: float = 1.0,
+        max_rate: float = 0.05,
+        burst: float = 10.0,
+        window: int = 1000,
+        min_samples: int = 20,
+    ) -> None:
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.max_rate = max_rate
+        self.burst = burst
+        self.min_samples = min_samples
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.denied = 0
+        self._credits = burst
+        self._samples: deque[float] = deque(maxlen=window)
+        self._delay = max_delay
+        self._stale = 0
+
+    def delay(self) -> float:
+        if len(self._samples) < self.min_samples:
+            return self.max_delay
+        # Re-sorting the window on every request is wasteful; refresh the
+        # cached percentile every few samples instead.
+        if self._stale >= max(1, self.min_samples // 2):
+            ordered = sorted(self._samples)
+            index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+            self._delay = min(self.max_delay, max(self.min_delay, ordered[index]))
+            self._stale = 0
+        return self._delay
+
+    def record(self, latency: float) -> None:
+        self._samples.append(latency)
+        self._stale += 1
+
+    async def run(self, send: Callable[[], Awaitable[Any]]) -> Any:
+        self.requests += 1
+        self._credits = min(self.burst, self._credits + self.max_rate)
+        started = time.monotonic()
+        primary = asyncio.ensure_future(send())
+        done, pending = set(), {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self.delay())
+            if not done:
+                if self._credits >= 1:
+                    self._credits -= 1
+                    self.hedged += 1
+                    pending.add(asyncio.ensure_future(send()))
+                else:
+                    self.denied += 1
+            error = None
+            while pending or done:
+                if not done:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                task = done.pop()
+                exception = task.exception()
+                # An HTTP error response is the core's answer; the other copy
+                # would get the same one. Transport errors wait for it.
+                if exception is None or isinstance(exception, RequestResponseError):
+                    if exception is None:
+                        self.record(time.monotonic() - started)
+                    if task is not primary:
+                        self.hedge_wins += 1
+                    return task.result()
+                error = error or exception
+            raise error
+        finally:
+            for task in done:
+                task.exception()
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def stats(self) -> dict:
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "denied": self.denied,
+            "delay": self.delay(),
+        }
@@ -0,0 +1,48 @@
+import asyncio
+import time
+from typing import Optional
+
+from .metrics import Histogram
+
+LAG_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class LoopLagMonitor:
+    """Measure how late the event loop wakes up a sleeping task.
+
+    Every ``interval`` seconds a background task records how much longer
+    than requested its sleep took; that delay is what any other coroutine
+    ready at the same moment had to wait. Use as an async context manager
+    or call ``start``/``stop``.
+    """
+
+    def __init__(self, interval: float = 0.01) -> None:
+        self.interval = interval
+        self.lag = Histogram(LAG_BUCKETS)
+        self._task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "LoopLagMonitor":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.lag.observe(max(0.0, time.perf_counter() - started - self.interval))
+
+    def stats(self) -> dict:
+        return self.lag.stats()
@@ -0,0 +1,151 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any, Optional
+
+from .breaker import endpoint_group
+
+
+class TokenBucket:
+    """Token bucket refilled at ``rate`` tokens per second up to ``burst``."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        self._refill()
+        if self._tokens < tokens:
+            return False
+        self._tokens -= tokens
+        return True
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait until ``tokens`` are available and take them.
+
+        Tokens are reserved up front, so waiters are served in arrival order
+        without polling.
+        """
+        self._refill()
+        self._tokens -= tokens
+        if self._tokens >= 0:
+            return
+        try:
+            await asyncio.sleep(-self._tokens / self.rate)
+        except asyncio.CancelledError:
+            self._tokens += tokens
+            raise
+
+
+class _Limit:
+    __slots__ = ("bucket", "semaphore", "requests", "queued", "inflight", "waited")
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        max_inflight: Optional[int] = None,
+    ) -> None:
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.semaphore = asyncio.Semaphore(max_inflight) if max_inflight else None
+        self.requests = 0
+        self.queued = 0
+        self.inflight = 0
+        self.waited = [0.0, 0.0]
+
+    def stats(self) -> dict:
+        total, longest = self.waited
+        return {
+            "requests": self.requests,
+            "queued": self.queued,
+            "inflight": self.inflight,
+            "wait_total": total,
+            "wait_avg": total / self.requests if self.requests else 0.0,
+            "wait_max": longest,
+        }
+
+
+class RequestLimiter:
+    """Limit request rate and concurrency, globally and per endpoint group.
+
+    ``rate``/``burst`` configure a token bucket and ``max_inflight`` a
+    semaphore shared by all requests. ``groups`` maps an endpoint group
+    (the leading literal path segments of the route template, e.g.
+    ``/api/subscriptions`` or ``/guards``) to the same three options for
+    that group alone. Time spent waiting for a slot is reported by
+    ``stats()``.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        max_inflight: Optional[int] = None,
+        groups: Optional[dict[str, dict]] = None,
+        depth: int = 2,
+    ) -> None:
+        self.depth = depth
+        self._global = _Limit(rate, burst, max_inflight)
+        self._groups = {
+            group: _Limit(**options) for group, options in (groups or {}).items()
+        }
+
+    async def call(self, endpoint: str, send: Callable[[], Awaitable[Any]]) -> Any:
+        async with self.slot(endpoint):
+            return await send()
+
+    @asynccontextmanager
+    async def slot(self, endpoint: str) -> AsyncIterator[None]:
+        """Wait for a slot and hold it until the block, e.g. a stream, ends."""
+        group = self._groups.get(endpoint_group(endpoint, self.depth))
+        limits = (self._global,) if group is None else (group, self._global)
+        started = time.monotonic()
+        acquired = []
+        for limit in limits:
+            limit.queued += 1
+        try:
+            # Group slots first, so a saturated group does not sit on
+            # global slots other groups could use.
+            for limit in limits:
+                if limit.semaphore is not None:
+                    await limit.semaphore.acquire()
+                    acquired.append(limit.semaphore)
+            for limit in limits:
+                if limit.bucket is not None:
+                    await limit.bucket.acquire()
+        except BaseException:
+            for semaphore in acquired:
+                semaphore.release()
+            raise
+        finally:
+            waited = time.monotonic() - started
+            for limit in limits:
+                limit.queued -= 1
+                limit.requests += 1
+                limit.waited[0] += waited
+                limit.waited[1] = max(limit.waited[1], waited)
+        for limit in limits:
+            limit.inflight += 1
+        try:
+            yield
+        finally:
+            for limit in limits:
+                limit.inflight -= 1
+            for semaphore in acquired:
+                semaphore.release()
+
+    def stats(self) -> dict:
+        return {
+            **self._global.stats(),
+            "groups": {group: limit.stats() for group, limit in self._groups.items()},
+        }
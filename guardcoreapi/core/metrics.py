@@ -0,0 +1,187 @@
+import math
+from bisect import bisect_left
+from typing import Optional
+
+from .tracing import RequestTrace
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+class Histogram:
+    """Fixed-bucket histogram with Prometheus ``le`` semantics.
+
+    Quantiles are interpolated inside their bucket and clamped to the
+    smallest and largest values observed, which are tracked exactly.
+    """
+
+    __slots__ = ("bounds", "counts", "sum", "count", "min", "max")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile by interpolating inside its bucket."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                break
+            seen += count
+        # The overflow bucket is bounded by the largest value seen.
+        lower = self.bounds[index - 1] if index else 0.0
+        upper = self.bounds[index] if index < len(self.bounds) else self.max
+        estimate = lower + (upper - lower) * (rank - seen) / count
+        return min(self.max, max(self.min, estimate))
+
+    def stats(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "max": self.max if self.count else None,
+        }
+
+
+class _RouteMetrics:
+    __slots__ = ("latency", "size", "errors", "cancelled", "inflight")
+
+    def __init__(self, latency_buckets, size_buckets) -> None:
+        self.latency = Histogram(latency_buckets)
+        self.size = Histogram(size_buckets)
+        self.errors: dict[str, int] = {}
+        self.cancelled = 0
+        self.inflight = 0
+
+
+def _labels(**labels: str) -> str:
+    escaped = (
+        value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        for value in labels.values()
+    )
+    pairs = (f'{name}="{value}"' for name, value in zip(labels, escaped))
+    return "{" + ",".join(pairs) + "}"
+
+
+class RequestMetrics:
+    """Per-route request metrics collected by ``RequestCore``.
+
+    Routes are endpoint templates such as ``/api/subscriptions/{username}``,
+    keyed together with the HTTP method. Each keeps a latency and a
+    response-size histogram with fixed buckets, error counts by exception
+    class and an in-flight gauge, so memory does not grow with traffic.
+    Cancelled attempts, such as the losing copy of a hedged request, are
+    only counted as ``cancelled`` and stay out of the histograms, as do
+    requests refused before being sent, which only count as errors (e.g.
+    ``CircuitOpenError``).
+    """
+
+    def __init__(
+        self,
+        latency_buckets: tuple[float, ...] = LATENCY_BUCKETS,
+        size_buckets: tuple[float, ...] = SIZE_BUCKETS,
+    ) -> None:
+        self.latency_buckets = latency_buckets
+        self.size_buckets = size_buckets
+        self._routes: dict[tuple[str, str], _RouteMetrics] = {}
+
+    def _route(self, method: str, route: str) -> _RouteMetrics:
+        metrics = self._routes.get((method, route))
+        if metrics is None:
+            metrics = _RouteMetrics(self.latency_buckets, self.size_buckets)
+            self._routes[(method, route)] = metrics
+        return metrics
+
+    def started(self, trace: RequestTrace) -> None:
+        self._route(trace.method, trace.route).inflight += 1
+
+    def finished(self, trace: RequestTrace) -> None:
+        metrics = self._route(trace.method, trace.route)
+        metrics.inflight -= 1
+        if trace.cancelled:
+            metrics.cancelled += 1
+            return
+        metrics.latency.observe(trace.phases["total"])
+        if trace.error is None:
+            metrics.size.observe(trace.bytes)
+        else:
+            metrics.errors[trace.error] = metrics.errors.get(trace.error, 0) + 1
+
+    def refused(self, method: str, route: str, error: str) -> None:
+        """Count a request refused before it was sent, e.g. by the breaker."""
+        metrics = self._route(method, route)
+        metrics.errors[error] = metrics.errors.get(error, 0) + 1
+
+    def stats(self) -> dict:
+        return {
+            f"{method} {route}": {
+                "inflight": metrics.inflight,
+                "latency": metrics.latency.stats(),
+                "size": metrics.size.stats(),
+                "errors": dict(metrics.errors),
+                "cancelled": metrics.cancelled,
+            }
+            for (method, route), metrics in self._routes.items()
+        }
+
+    def render_prometheus(self, prefix: str = "guardcore_client") -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        lines = []
+        for name, attr, help_text in (
+            ("request_duration_seconds", "latency", "Request latency."),
+            ("response_size_bytes", "size", "Response body size."),
+        ):
+            metric = f"{prefix}_{name}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} histogram")
+            for (method, route), metrics in self._routes.items():
+                histogram: Histogram = getattr(metrics, attr)
+                cumulative = 0
+                for bound, count in zip((*histogram.bounds, "+Inf"), histogram.counts):
+                    cumulative += count
+                    labels = _labels(method=method, route=route, le=str(bound))
+                    lines.append(f"{metric}_bucket{labels} {cumulative}")
+                labels = _labels(method=method, route=route)
+                lines.append(f"{metric}_sum{labels} {histogram.sum}")
+                lines.append(f"{metric}_count{labels} {histogram.count}")
+
+        metric = f"{prefix}_request_errors_total"
+        lines.append(f"# HELP {metric} Failed requests by exception class.")
+        lines.append(f"# TYPE {metric} counter")
+        for (method, route), metrics in self._routes.items():
+            for error, count in metrics.errors.items():
+                labels = _labels(method=method, route=route, error=error)
+                lines.append(f"{metric}{labels} {count}")
+
+        metric = f"{prefix}_requests_cancelled_total"
+        lines.append(f"# HELP {metric} Cancelled requests, e.g. lost hedges.")
+        lines.append(f"# TYPE {metric} counter")
+        for (method, route), metrics in self._routes.items():
+            labels = _labels(method=method, route=route)
+            lines.append(f"{metric}{labels} {metrics.cancelled}")
+
+        metric = f"{prefix}_requests_in_flight"
+        lines.append(f"# HELP {metric} Requests currently in flight.")
+        lines.append(f"# TYPE {metric} gauge")
+        for (method, route), metrics in self._routes.items():
+            labels = _labels(method=method, route=route)
+            lines.append(f"{metric}{labels} {metrics.inflight}")
+        return "\n".join(lines) + "\n"
@@ -1,18 +1,200 @@
 import asyncio
+import functools
+import time
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import AsyncExitStack
 from typing import Optional
 
 import aiohttp
 from pydantic import BaseModel
 from .exceptions import (
+    CircuitOpenError,
+    GuardCoreApiException,
     RequestAuthenticationError,
     RequestConnectionError,
     RequestResponseError,
     RequestTimeoutError,
 )
+from .codec import JSONCodec, default_codec
+from .coalesce import SingleFlight
+from .breaker import CircuitBreaker
+from .hedge import HedgePolicy
+from .metrics import RequestMetrics
+from .limiter import RequestLimiter
+from .retry import RetryPolicy, parse_retry_after
+from .stream import iter_json_array
+from .tracing import RequestTrace, TraceHook, emit, trace_config
+from .validation import (
+    ValidationMode,
+    type_adapter,
+    validate_chunked,
+    validate_items,
+)
+
+
+class _default_method:
+    """Bind to ``RequestCore.default()`` when looked up on the class.
+
+    ``fetch`` and the verb helpers used to be static methods, so
+    ``await RequestCore.get(...)`` keeps using the shared instance.
+    """
+
+    def __init__(self, func) -> None:
+        self.func = func
+        functools.update_wrapper(self, func)
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            instance = owner.default()
+        return self.func.__get__(instance, owner)
 
 
 class RequestCore:
+    """Send requests to the Guard core over one pooled session.
+
+    ``offload_threshold`` (off by default) moves decoding and full
+    validation of responses of at least that many bytes to a worker thread,
+    validating in short steps so other coroutines on the loop get to run.
+    It costs throughput and only softens the stalls, since decoding stays
+    one step; ``benchmarks/bench_offload.py`` compares both. Enable it when
+    loop latency matters more than bulk speed.
+    """
+
     _BASE_URL = "https://core.erfjab.com"
+    _default: Optional["RequestCore"] = None
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        ttl_dns_cache: Optional[int] = 300,
+        keepalive_timeout: float = 15.0,
+        codec: Optional[JSONCodec] = None,
+        validate: ValidationMode = "full",
+        coalesce: bool = False,
+        hedge: Optional[HedgePolicy] = None,
+        retry: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        limiter: Optional[RequestLimiter] = None,
+        hooks: Optional[list[TraceHook]] = None,
+        metrics: Optional[RequestMetrics] = None,
+        offload_threshold: Optional[int] = None,
+    ) -> None:
+        self.base_url = (base_url or RequestCore._BASE_URL).rstrip("/")
+        self.codec = codec or default_codec()
+        self.validate = validate
+        self.singleflight = SingleFlight() if coalesce else None
+        self.hedge = hedge
+        self.retry = retry
+        self.breaker = breaker
+        self.limiter = limiter
+        self.hooks: list[TraceHook] = list(hooks or [])
+        self.metrics = metrics
+        self.offload_threshold = offload_threshold
+        self._connector_options = {
+            "limit": limit,
+            "limit_per_host": limit_per_host,
+            "ttl_dns_cache": ttl_dns_cache,
+            "keepalive_timeout": keepalive_timeout,
+        }
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closer: Optional[AsyncGenerator[None, None]] = None
+
+    @classmethod
+    def default(cls) -> "RequestCore":
+        """Return the process-wide instance used by ``GuardCoreApi``."""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    async def startup(
+        self,
+        limit: Optional[int] = None,
+        limit_per_host: Optional[int] = None,
+        ttl_dns_cache: Optional[int] = None,
+        keepalive_timeout: Optional[float] = None,
+    ) -> aiohttp.ClientSession:
+        """Open the pooled session, replacing any existing one.
+
+        Options left as ``None`` keep their previous value. ``limit`` and
+        ``limit_per_host`` accept ``0`` for no limit.
+        """
+        options = {
+            "limit": limit,
+            "limit_per_host": limit_per_host,
+            "ttl_dns_cache": ttl_dns_cache,
+            "keepalive_timeout": keepalive_timeout,
+        }
+        self._connector_options.update(
+            {key: value for key, value in options.items() if value is not None}
+        )
+        await self.shutdown()
+        session = self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(**self._connector_options),
+            trace_configs=[trace_config()] if self.hooks else None,
+        )
+        self._session_loop = asyncio.get_running_loop()
+        # asyncio.run closes async generators before the loop itself, so
+        # this one closes a session nobody shut down while it still can.
+        self._closer = self._close_with_loop(session)
+        await self._closer.asend(None)
+        return session
+
+    @staticmethod
+    async def _close_with_loop(session: aiohttp.ClientSession) -> AsyncIterator[None]:
+        try:
+            yield
+        finally:
+            await session.close()
+
+    @staticmethod
+    def _discard(session: aiohttp.ClientSession) -> None:
+        """Close a session whose event loop is gone without awaiting it."""
+        connector = session.connector
+        if connector is not None:
+            # What aiohttp itself does for a connector garbage-collected open.
+            connector._close()
+        session.detach()
+
+    def add_hook(self, hook: TraceHook) -> None:
+        """Call ``hook`` with a ``RequestTrace`` after every fetch attempt.
+
+        Network phases are only traced on sessions opened while a hook is
+        registered; without hooks no tracing work is done at all.
+        """
+        self.hooks.append(hook)
+
+    async def shutdown(self) -> None:
+        """Close the session and release its pooled connections."""
+        session, self._session = self._session, None
+        loop, self._session_loop = self._session_loop, None
+        closer, self._closer = self._closer, None
+        if session is not None and not session.closed:
+            if loop is asyncio.get_running_loop():
+                await session.close()
+            else:
+                self._discard(session)
+        if closer is not None:
+            await closer.aclose()
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Return the session, opening it on first use.
+
+        A session bound to another (e.g. already finished) event loop is
+        closed and replaced, so separate ``asyncio.run`` calls keep working.
+        A session opened here is closed when ``asyncio.run`` shuts its loop
+        down; with other loop management call ``shutdown()`` (for the
+        shared instance ``GuardCoreApi.shutdown()``) before the loop ends.
+        """
+        if (
+            self._session is None
+            or self._session.closed
+            or self._session_loop is not asyncio.get_running_loop()
+        ):
+            return await self.startup()
+        return self._session
 
     @staticmethod
     def generate_headers(
@@ -30,7 +212,49 @@ class RequestCore:
         return headers
 
     @staticmethod
+    def _query_params(params: Optional[dict]) -> Optional[dict]:
+        if not params:
+            return params
+        return {
+            key: str(value).lower() if isinstance(value, bool) else value
+            for key, value in params.items()
+        }
+
+    async def _raise_for_status(
+        self,
+        response: aiohttp.ClientResponse,
+        endpoint: str,
+        json: Optional[dict] = None,
+        data: Optional[dict] = None,
+    ) -> None:
+        try:
+            error_data = await response.json()
+            error_detail = error_data.get("detail", "Unknown error")
+        except Exception:
+            error_detail = await response.text()
+
+        url = self.base_url + endpoint
+        error_msg = f"Invalid response ({response.status}): {error_detail}\nURL: {url}"
+        if json:
+            error_msg += f"\nData: {json}"
+        elif data:
+            error_msg += f"\nData: {data}"
+
+        if response.status == 401:
+            raise RequestAuthenticationError(
+                f"Authentication failed: {error_detail}\nURL: {url}",
+                status=response.status,
+            )
+        else:
+            raise RequestResponseError(
+                error_msg,
+                status=response.status,
+                retry_after=parse_retry_after(response.headers.get("Retry-After")),
+            )
+
+    @_default_method
     async def fetch(
+        self,
         endpoint: str,
         method: str = "GET",
         headers: Optional[dict] = None,
@@ -40,57 +264,257 @@ class RequestCore:
         response_model: Optional[BaseModel] = None,
         use_list: bool = False,
         timeout: float = 10.0,
+        validate: Optional[ValidationMode] = None,
+        idempotent: Optional[bool] = None,
+        route: Optional[str] = None,
     ) -> dict:
+        """Send a request and decode its JSON response.
+
+        With a retry policy set, GETs are retried on transient failures;
+        other methods only when ``idempotent`` is true. ``route`` is the
+        endpoint template (e.g. ``/guards/{secret}``) that metrics, circuits
+        and limits are grouped by; without it the concrete endpoint is used.
+        """
+        params = self._query_params(params)
+        body = data
+        if json is not None:
+            body = self.codec.dumps(json)
+            if headers is None or "Content-Type" not in headers:
+                headers = {**(headers or {}), "Content-Type": "application/json"}
+        mode = validate or self.validate
+        group = route or endpoint
+
+        def request():
+            if self.limiter is not None:
+                return self.limiter.call(group, transfer)
+            return transfer()
+
+        def transfer():
+            return self._send(
+                endpoint,
+                method,
+                headers,
+                params,
+                body,
+                response_model,
+                use_list,
+                timeout,
+                mode,
+                json,
+                data,
+                route,
+            )
+
+        async def guarded():
+            try:
+                return await self.breaker.call(group, request)
+            except CircuitOpenError as e:
+                self._refused(method, group, e)
+                raise
+
+        attempt = request if self.breaker is None else guarded
+
+        def hedged():
+            if self.hedge is not None and method == "GET":
+                return self.hedge.run(attempt)
+            return attempt()
+
+        def send():
+            if self.retry is not None and (
+                idempotent if idempotent is not None else method == "GET"
+            ):
+                return self.retry.run(hedged)
+            return hedged()
+
+        if self.singleflight is not None and method == "GET":
+            key = (
+                endpoint,
+                tuple(sorted(params.items())) if params else None,
+                tuple(sorted(headers.items())) if headers else None,
+                response_model,
+                use_list,
+                mode,
+            )
+            return await self.singleflight.do(key, send)
+        return await send()
+
+    def _refused(self, method: str, route: str, error: Exception) -> None:
+        if self.metrics is not None:
+            self.metrics.refused(method, route, type(error).__name__)
+
+    async def _send(
+        self,
+        endpoint: str,
+        method: str,
+        headers: Optional[dict],
+        params: Optional[dict],
+        body,
+        response_model: Optional[BaseModel],
+        use_list: bool,
+        timeout: float,
+        mode: ValidationMode,
+        json: Optional[dict] = None,
+        data: Optional[dict] = None,
+        route: Optional[str] = None,
+    ):
+        args = (endpoint, method, headers, params, body, response_model, use_list)
+        if not self.hooks and self.metrics is None:
+            return await self._transfer(*args, timeout, mode, json, data, None)
+
+        trace = RequestTrace(method, route or endpoint, endpoint)
+        if self.metrics is not None:
+            self.metrics.started(trace)
         try:
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=timeout)
-            ) as session:
-                async with session.request(
-                    method=method,
-                    url=RequestCore._BASE_URL + endpoint,
-                    headers=headers,
-                    params=params,
-                    data=data,
-                    json=json,
-                ) as response:
-                    if response.status >= 400:
-                        try:
-                            error_data = await response.json()
-                            error_detail = error_data.get("detail", "Unknown error")
-                        except Exception:
-                            error_detail = await response.text()
-
-                        url = RequestCore._BASE_URL + endpoint
-                        error_msg = f"Invalid response ({response.status}): {error_detail}\nURL: {url}"
-                        if json:
-                            error_msg += f"\nData: {json}"
-                        elif data:
-                            error_msg += f"\nData: {data}"
-
-                        if response.status == 401:
-                            raise RequestAuthenticationError(
-                                f"Authentication failed: {error_detail}\nURL: {url}"
-                            )
-                        else:
-                            raise RequestResponseError(error_msg)
-
-                    resp_json = await response.json()
-                    if response_model:
-                        if use_list:
-                            return [response_model(**item) for item in resp_json]
-                        return response_model(**resp_json)
-                    return resp_json
+            return await self._transfer(*args, timeout, mode, json, data, trace)
+        except GuardCoreApiException as e:
+            trace.error = type(e).__name__
+            raise
+        except asyncio.CancelledError:
+            trace.cancelled = True
+            raise
+        finally:
+            trace.phases["total"] = time.perf_counter() - trace.started
+            if self.metrics is not None:
+                self.metrics.finished(trace)
+            emit(self.hooks, trace)
+
+    async def _transfer(
+        self,
+        endpoint: str,
+        method: str,
+        headers: Optional[dict],
+        params: Optional[dict],
+        body,
+        response_model: Optional[BaseModel],
+        use_list: bool,
+        timeout: float,
+        mode: ValidationMode,
+        json: Optional[dict],
+        data: Optional[dict],
+        trace: Optional[RequestTrace],
+    ):
+        try:
+            session = await self.get_session()
+            async with session.request(
+                method=method,
+                url=self.base_url + endpoint,
+                headers=headers,
+                params=params,
+                data=body,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+                trace_request_ctx=trace,
+            ) as response:
+                if trace is not None:
+                    trace.status = response.status
+                if response.status >= 400:
+                    await self._raise_for_status(response, endpoint, json, data)
+
+                raw = await response.read()
+                if trace is not None:
+                    trace.bytes = len(raw)
+                    trace.since("download", "headers")
+                    trace.mark("decode")
+                if response_model and mode == "full":
+                    if (
+                        self.offload_threshold is not None
+                        and len(raw) >= self.offload_threshold
+                    ):
+                        # Keep the event loop responsive while a huge
+                        # response is validated.
+                        result = await asyncio.to_thread(
+                            validate_chunked,
+                            response_model,
+                            raw,
+                            use_list,
+                            self.codec.loads,
+                        )
+                    else:
+                        adapter = type_adapter(response_model, use_list)
+                        result = adapter.validate_json(raw)
+                    if trace is not None:
+                        trace.since("validate", "decode")
+                    return result
+                resp_json = self.codec.loads(raw) if raw.strip() else None
+                if trace is not None:
+                    trace.since("decode", "decode")
+                    trace.mark("validate")
+                if response_model:
+                    resp_json = validate_items(
+                        response_model, resp_json, mode, use_list
+                    )
+                    if trace is not None:
+                        trace.since("validate", "validate")
+                return resp_json
         except aiohttp.ClientConnectionError as e:
-            url = RequestCore._BASE_URL + endpoint
+            url = self.base_url + endpoint
             raise RequestConnectionError(
                 f"Connection error occurred\nURL: {url}"
             ) from e
         except asyncio.TimeoutError as e:
-            url = RequestCore._BASE_URL + endpoint
+            url = self.base_url + endpoint
             raise RequestTimeoutError(f"Request timed out\nURL: {url}") from e
 
-    @staticmethod
+    async def stream(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        headers: Optional[dict] = None,
+        params: Optional[dict] = None,
+        response_model: Optional[BaseModel] = None,
+        timeout: float = 10.0,
+        validate: Optional[ValidationMode] = None,
+        chunk_size: int = 65536,
+        route: Optional[str] = None,
+    ) -> AsyncIterator:
+        """Yield the items of a JSON array response as they are downloaded.
+
+        ``timeout`` bounds connecting and each socket read instead of the
+        whole transfer, so long listings are not cut off midway. The
+        breaker and limiter apply as for ``fetch``; a limiter slot is held
+        until the stream ends.
+        """
+        params = self._query_params(params)
+        async with AsyncExitStack() as stack:
+            group = route or endpoint
+            if self.breaker is not None:
+                try:
+                    await stack.enter_async_context(self.breaker.guard(group))
+                except CircuitOpenError as e:
+                    self._refused(method, group, e)
+                    raise
+            if self.limiter is not None:
+                await stack.enter_async_context(self.limiter.slot(group))
+            try:
+                session = await self.get_session()
+                async with session.request(
+                    method=method,
+                    url=self.base_url + endpoint,
+                    headers=headers,
+                    params=params,
+                    timeout=aiohttp.ClientTimeout(
+                        total=None, sock_connect=timeout, sock_read=timeout
+                    ),
+                ) as response:
+                    if response.status >= 400:
+                        await self._raise_for_status(response, endpoint)
+
+                    mode = validate or self.validate
+                    async for item in iter_json_array(response.content, chunk_size):
+                        if response_model:
+                            item = validate_items(response_model, item, mode)
+                        yield item
+            except aiohttp.ClientConnectionError as e:
+                url = self.base_url + endpoint
+                raise RequestConnectionError(
+                    f"Connection error occurred\nURL: {url}"
+                ) from e
+            except asyncio.TimeoutError as e:
+                url = self.base_url + endpoint
+                raise RequestTimeoutError(f"Request timed out\nURL: {url}") from e
+
+    @_default_method
     async def get(
+        self,
         endpoint: str,
         headers: Optional[dict] = None,
         params: Optional[dict] = None,
@@ -98,7 +522,7 @@ class RequestCore:
         use_list: bool = False,
         timeout: float = 10.0,
     ) -> dict:
-        return await RequestCore.fetch(
+        return await self.fetch(
             endpoint=endpoint,
             method="GET",
             headers=headers,
@@ -108,8 +532,9 @@ class RequestCore:
             response_model=response_model,
         )
 
-    @staticmethod
+    @_default_method
     async def post(
+        self,
         endpoint: str,
         headers: Optional[dict] = None,
         params: Optional[dict] = None,
@@ -119,7 +544,7 @@ class RequestCore:
         response_model: Optional[BaseModel] = None,
         use_list: bool = False,
     ) -> dict:
-        return await RequestCore.fetch(
+        return await self.fetch(
             endpoint=endpoint,
             method="POST",
             headers=headers,
@@ -131,8 +556,9 @@ class RequestCore:
             use_list=use_list,
         )
 
-    @staticmethod
+    @_default_method
     async def put(
+        self,
         endpoint: str,
         headers: Optional[dict] = None,
         params: Optional[dict] = None,
@@ -142,7 +568,7 @@ class RequestCore:
         response_model: Optional[BaseModel] = None,
         use_list: bool = False,
     ) -> dict:
-        return await RequestCore.fetch(
+        return await self.fetch(
             endpoint=endpoint,
             method="PUT",
             headers=headers,
@@ -154,13 +580,14 @@ class RequestCore:
             use_list=use_list,
         )
 
-    @staticmethod
+    @_default_method
     async def delete(
+        self,
         endpoint: str,
         headers: Optional[dict] = None,
         timeout: float = 10.0,
     ) -> dict:
-        return await RequestCore.fetch(
+        return await self.fetch(
             endpoint=endpoint,
             method="DELETE",
             headers=headers,
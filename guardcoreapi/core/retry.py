@@ -0,0 +1,85 @@
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional
+
+from .exceptions import (
+    GuardCoreApiException,
+    RequestConnectionError,
+    RequestTimeoutError,
+)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Return the seconds a ``Retry-After`` header asks to wait, if any."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """Retry failed idempotent requests with exponential backoff.
+
+    Connection errors, timeouts and responses with one of ``statuses`` are
+    retried up to ``attempts`` tries in total. The wait before retry ``n`` is
+    drawn uniformly from ``[0, min(max_delay, base_delay * 2 ** (n - 1))]``
+    (full jitter), or taken from ``Retry-After`` when the core sends it with
+    a 429 or 503. No retry starts once ``budget`` seconds would be exceeded.
+    """
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        base_delay: float = 0.1,
+        max_delay: float = 5.0,
+        budget: float = 30.0,
+        statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504}),
+    ) -> None:
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.statuses = statuses
+        self.retries = 0
+        self.exhausted = 0
+
+    def retryable(self, error: GuardCoreApiException) -> bool:
+        if isinstance(error, (RequestConnectionError, RequestTimeoutError)):
+            return True
+        return error.status in self.statuses
+
+    def backoff(self, attempt: int, error: GuardCoreApiException) -> float:
+        if error.retry_after is not None and error.status in (429, 503):
+            return error.retry_after
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    async def run(self, send: Callable[[], Awaitable[Any]]) -> Any:
+        deadline = time.monotonic() + self.budget
+        attempt = 1
+        while True:
+            try:
+                return await send()
+            except GuardCoreApiException as error:
+                error.attempts = attempt
+                if attempt >= self.attempts or not self.retryable(error):
+                    raise
+                delay = self.backoff(attempt, error)
+                if time.monotonic() + delay > deadline:
+                    self.exhausted += 1
+                    raise
+            self.retries += 1
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    def stats(self) -> dict:
+        return {"retries": self.retries, "exhausted": self.exhausted}
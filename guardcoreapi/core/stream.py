@@ -0,0 +1,95 @@
+import codecs
+import json
+import re
+from collections.abc import AsyncIterator
+from typing import Any
+
+import aiohttp
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# What the decoder has just read inside the array.
+_OPENED = 0
+_VALUE = 1
+_COMMA = 2
+
+
+class JSONArrayDecoder:
+    """Incrementally split a top-level JSON array into its decoded items."""
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._started = False
+        self._finished = False
+        self._last = _OPENED
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        self._buffer += self._utf8.decode(chunk)
+        return self._drain(final=False)
+
+    def close(self) -> list[Any]:
+        self._buffer += self._utf8.decode(b"", final=True)
+        items = self._drain(final=True)
+        if not self._finished:
+            raise ValueError("Incomplete JSON array")
+        return items
+
+    def _drain(self, final: bool) -> list[Any]:
+        items = []
+        buffer = self._buffer
+        length = len(buffer)
+        pos = 0
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos >= length:
+                break
+            char = buffer[pos]
+            if self._finished:
+                raise ValueError("Extra data after JSON array")
+            if not self._started:
+                if char != "[":
+                    raise ValueError("Expected a JSON array")
+                self._started = True
+                pos += 1
+            elif char == "]":
+                if self._last == _COMMA:
+                    raise ValueError("Trailing ',' in JSON array")
+                self._finished = True
+                pos += 1
+            elif char == ",":
+                if self._last != _VALUE:
+                    raise ValueError("Expected a value before ',' in JSON array")
+                self._last = _COMMA
+                pos += 1
+            else:
+                try:
+                    item, end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break
+                # A value not followed by a delimiter yet (e.g. a number cut
+                # at a chunk boundary) may still continue in the next chunk.
+                end = _WHITESPACE.match(buffer, end).end()
+                if end >= length or buffer[end] not in ",]":
+                    if final:
+                        raise ValueError("Expected ',' or ']' in JSON array")
+                    break
+                items.append(item)
+                self._last = _VALUE
+                pos = end
+        self._buffer = buffer[pos:]
+        return items
+
+
+async def iter_json_array(
+    content: aiohttp.StreamReader, chunk_size: int = 65536
+) -> AsyncIterator[Any]:
+    decoder = JSONArrayDecoder()
+    async for chunk in content.iter_chunked(chunk_size):
+        for item in decoder.feed(chunk):
+            yield item
+    for item in decoder.close():
+        yield item
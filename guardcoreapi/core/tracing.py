@@ -0,0 +1,82 @@
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class RequestTrace:
+    """Timing of one ``RequestCore.fetch`` attempt, passed to trace hooks.
+
+    ``route`` is the endpoint template (``/api/subscriptions/{username}``).
+    ``phases`` holds durations in seconds: ``queue`` (waiting for a pooled
+    connection), ``dns``, ``connect`` (including DNS), ``ttfb`` (request
+    sent to response headers), ``download``, ``decode`` and ``validate``.
+    When a model is validated straight from the raw body, parsing is part
+    of ``validate``. ``total`` covers the whole attempt. ``error`` names the
+    ``GuardCoreApiException`` subclass a failed attempt raised;
+    ``cancelled`` is set when the attempt was cancelled instead, e.g. as
+    the losing copy of a hedged request.
+    """
+
+    method: str
+    route: str
+    endpoint: str
+    status: Optional[int] = None
+    bytes: int = 0
+    error: Optional[str] = None
+    cancelled: bool = False
+    phases: dict[str, float] = field(default_factory=dict)
+    started: float = field(default_factory=time.perf_counter)
+    _marks: dict[str, float] = field(default_factory=dict, repr=False)
+
+    def mark(self, name: str) -> None:
+        self._marks[name] = time.perf_counter()
+
+    def since(self, phase: str, mark: str) -> None:
+        start = self._marks.get(mark)
+        if start is not None:
+            self.phases[phase] = time.perf_counter() - start
+
+
+TraceHook = Callable[[RequestTrace], None]
+
+
+def emit(hooks: list[TraceHook], trace: RequestTrace) -> None:
+    for hook in hooks:
+        try:
+            hook(trace)
+        except Exception:
+            logger.exception("Trace hook %r failed", hook)
+
+
+def _on(mark: Optional[str] = None, phase: Optional[str] = None, since: str = ""):
+    async def callback(session, context, params) -> None:
+        trace = context.trace_request_ctx
+        if not isinstance(trace, RequestTrace):
+            return
+        if phase is not None:
+            trace.since(phase, since)
+        if mark is not None:
+            trace.mark(mark)
+
+    return callback
+
+
+def trace_config() -> aiohttp.TraceConfig:
+    """Build the aiohttp ``TraceConfig`` that fills in network phases."""
+    config = aiohttp.TraceConfig()
+    config.on_connection_queued_start.append(_on("queue"))
+    config.on_connection_queued_end.append(_on(phase="queue", since="queue"))
+    config.on_dns_resolvehost_start.append(_on("dns"))
+    config.on_dns_resolvehost_end.append(_on(phase="dns", since="dns"))
+    config.on_connection_create_start.append(_on("connect"))
+    config.on_connection_create_end.append(_on(phase="connect", since="connect"))
+    config.on_request_headers_sent.append(_on("sent"))
+    config.on_request_end.append(_on("headers", phase="ttfb", since="sent"))
+    return config
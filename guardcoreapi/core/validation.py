@@ -0,0 +1,143 @@
+from functools import lru_cache
+from typing import Any, Callable, Literal, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+
+ValidationMode = Literal["full", "none", "lazy"]
+
+
+@lru_cache(maxsize=None)
+def type_adapter(model: type[BaseModel], many: bool = False) -> TypeAdapter:
+    """Return a cached adapter validating ``model`` or ``list[model]``."""
+    return TypeAdapter(list[model] if many else model)
+
+
+_PLAIN_TYPES = (str, int, float, bool)
+
+
+@lru_cache(maxsize=None)
+def _field_validators(model: type[BaseModel]) -> dict[str, tuple]:
+    """Map each field to ``(plain type or None, nullable, adapter)``.
+
+    JSON values that already have the exact plain type of their field (or are
+    ``None`` for a nullable field) are used as-is without calling pydantic.
+    """
+    validators = {}
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        nullable = len(args) != len(get_args(annotation))
+        plain = args[0] if nullable and len(args) == 1 else annotation
+        validators[name] = (
+            plain if plain in _PLAIN_TYPES else None,
+            nullable,
+            TypeAdapter(annotation),
+        )
+    return validators
+
+
+class LazyModel:
+    """Read-only view of a response item that validates fields on access.
+
+    Only the fields that are actually read pay for validation; ``to_model``
+    validates the whole item into the regular pydantic model.
+    """
+
+    __slots__ = ("_model", "_data", "_values")
+
+    def __init__(self, model: type[BaseModel], data: dict) -> None:
+        self._model = model
+        self._data = data
+        self._values: dict[str, Any] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            # Fields never start with "_"; this also keeps copy and pickle,
+            # which probe dunders before the slots are set, from recursing.
+            raise AttributeError(name)
+        values = self._values
+        if name in values:
+            return values[name]
+        validator = _field_validators(self._model).get(name)
+        if validator is None:
+            raise AttributeError(
+                f"{self._model.__name__!r} object has no attribute {name!r}"
+            )
+        if name in self._data:
+            value = self._data[name]
+            plain, nullable, adapter = validator
+            if not (type(value) is plain or (value is None and nullable)):
+                value = adapter.validate_python(value)
+        else:
+            field = self._model.model_fields[name]
+            if field.is_required():
+                raise AttributeError(f"{name!r} is missing from the response")
+            value = field.get_default(call_default_factory=True)
+        values[name] = value
+        return value
+
+    def __repr__(self) -> str:
+        return f"LazyModel[{self._model.__name__}]({self._data!r})"
+
+    @property
+    def raw(self) -> dict:
+        return self._data
+
+    def to_model(self) -> BaseModel:
+        return type_adapter(self._model).validate_python(self._data)
+
+
+def validate_items(
+    model: type[BaseModel], data: Any, mode: ValidationMode, many: bool = False
+) -> Any:
+    """Apply a non-``full`` validation mode to already decoded JSON."""
+    if mode == "none":
+        return data
+    if mode == "lazy":
+        if many:
+            return [LazyModel(model, item) for item in data]
+        return LazyModel(model, data)
+    return type_adapter(model, many).validate_python(data)
+
+
+def _validate_list(adapter: TypeAdapter, items: list, chunk_items: int) -> list:
+    result = []
+    for start in range(0, len(items), chunk_items):
+        result.extend(adapter.validate_python(items[start : start + chunk_items]))
+    return result
+
+
+def validate_chunked(
+    model: type[BaseModel],
+    raw: bytes,
+    many: bool,
+    loads: Callable[[bytes], Any],
+    chunk_items: int = 1000,
+) -> Any:
+    """Fully validate a large body in many short steps.
+
+    Meant to run in a worker thread: pydantic holds the GIL for a whole
+    call, so the event loop thread only gets to run between steps. The body
+    is decoded with ``loads`` (the configured codec) and arrays, as well as
+    list fields of a single object, longer than ``chunk_items`` are
+    validated in pieces.
+    """
+    data = loads(raw)
+    if many:
+        return _validate_list(type_adapter(model, True), data, chunk_items)
+    if isinstance(data, dict):
+        for name, field in model.model_fields.items():
+            key = field.alias or name
+            value = data.get(key)
+            args = get_args(field.annotation)
+            if (
+                isinstance(value, list)
+                and len(value) > chunk_items
+                and get_origin(field.annotation) is list
+                and isinstance(args[0], type)
+                and issubclass(args[0], BaseModel)
+            ):
+                # Validated instances are accepted as-is by the final pass.
+                adapter = type_adapter(args[0], True)
+                data = {**data, key: _validate_list(adapter, value, chunk_items)}
+    return type_adapter(model).validate_python(data)
@@ -0,0 +1,175 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from .client import GuardCoreClient
+from .core import (
+    RequestCore,
+    RequestResponseError,
+    RequestThrottledError,
+    TokenBucket,
+    TTLCache,
+)
+from .core.cache import MISSING
+from .types import SubscriptionResponse, SubscriptionUsageLogsResponse
+
+
+class GuardCache:
+    """Serve the public ``/guards/{secret}`` endpoints from local memory.
+
+    A result is fresh for ``ttl`` seconds. For ``stale_ttl`` seconds after
+    that it is still returned immediately while a single background request
+    refreshes it (stale-while-revalidate). At most ``maxsize`` results are
+    kept, least recently used first out.
+
+    Secrets the core rejects with one of ``negative_statuses`` are remembered
+    for ``negative_ttl`` seconds and fail locally without another request.
+    With ``source_rate`` set, each ``source`` passed to the ``get_guard*``
+    methods (a client IP, a user id) may start ``source_rate`` lookups per
+    second with bursts of ``source_burst``; further lookups raise
+    ``RequestThrottledError`` before touching the cache or the core.
+    """
+
+    def __init__(
+        self,
+        client: GuardCoreClient | None = None,
+        ttl: float = 30.0,
+        stale_ttl: float = 300.0,
+        maxsize: int = 10000,
+        negative_ttl: float = 60.0,
+        negative_maxsize: int = 100000,
+        negative_statuses: tuple[int, ...] = (400, 404, 422),
+        source_rate: float | None = None,
+        source_burst: float | None = None,
+        max_sources: int = 10000,
+    ) -> None:
+        self.client = client or GuardCoreClient(core=RequestCore.default())
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.negative_ttl = negative_ttl
+        self.negative_statuses = negative_statuses
+        self.source_rate = source_rate
+        self.source_burst = source_burst
+        self.fresh_hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.load_errors = 0
+        self.negative_hits = 0
+        self.throttled = 0
+        self._store = TTLCache(maxsize)
+        self._negative = TTLCache(negative_maxsize)
+        self._sources = TTLCache(max_sources)
+        self._loading: dict[Hashable, asyncio.Task] = {}
+
+    async def get_guard(self, secret: str, source: Hashable = None) -> list[str]:
+        return await self._get(("guard", secret), self.client.get_guard, secret, source)
+
+    async def get_guard_info(
+        self, secret: str, source: Hashable = None
+    ) -> SubscriptionResponse:
+        return await self._get(
+            ("info", secret), self.client.get_guard_info, secret, source
+        )
+
+    async def get_guard_usage_logs(
+        self, secret: str, source: Hashable = None
+    ) -> SubscriptionUsageLogsResponse:
+        return await self._get(
+            ("usages", secret), self.client.get_guard_usage_logs, secret, source
+        )
+
+    def invalidate(self, secret: str) -> None:
+        for kind in ("guard", "info", "usages"):
+            self._store.pop((kind, secret))
+        self._negative.pop(secret)
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._store),
+            "maxsize": self._store.maxsize,
+            "evictions": self._store.evictions,
+            "fresh_hits": self.fresh_hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refreshing": len(self._loading),
+            "load_errors": self.load_errors,
+            "negative_size": len(self._negative),
+            "negative_hits": self.negative_hits,
+            "sources": len(self._sources),
+            "throttled": self.throttled,
+        }
+
+    async def _get(
+        self,
+        key: Hashable,
+        fetch: Callable[[str], Awaitable[Any]],
+        secret: str,
+        source: Hashable = None,
+    ) -> Any:
+        if source is not None and self.source_rate is not None:
+            self._throttle(source)
+        rejected = self._negative.get(secret)
+        if rejected is not MISSING:
+            self.negative_hits += 1
+            message, status = rejected
+            raise RequestResponseError(message, status=status)
+        entry = self._store.get(key)
+        if entry is MISSING:
+            self.misses += 1
+            return await asyncio.shield(self._load(key, fetch, secret))
+        fresh_until, value = entry
+        if fresh_until > time.monotonic():
+            self.fresh_hits += 1
+        else:
+            self.stale_hits += 1
+            self._load(key, fetch, secret)
+        return value
+
+    def _load(
+        self,
+        key: Hashable,
+        fetch: Callable[[str], Awaitable[Any]],
+        secret: str,
+    ) -> asyncio.Task:
+        task = self._loading.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_store(key, fetch, secret))
+            self._loading[key] = task
+            task.add_done_callback(lambda done: self._loaded(key, done))
+        return task
+
+    async def _fetch_and_store(
+        self,
+        key: Hashable,
+        fetch: Callable[[str], Awaitable[Any]],
+        secret: str,
+    ) -> Any:
+        try:
+            value = await fetch(secret)
+        except RequestResponseError as error:
+            if error.status in self.negative_statuses:
+                self._negative.set(
+                    secret, (str(error), error.status), self.negative_ttl
+                )
+            raise
+        self._store.set(
+            key, (time.monotonic() + self.ttl, value), self.ttl + self.stale_ttl
+        )
+        return value
+
+    def _loaded(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._loading.get(key) is task:
+            del self._loading[key]
+        if not task.cancelled() and task.exception() is not None:
+            self.load_errors += 1
+
+    def _throttle(self, source: Hashable) -> None:
+        bucket = self._sources.get(source)
+        if bucket is MISSING:
+            bucket = TokenBucket(self.source_rate, self.source_burst)
+        # Idle sources expire once their bucket would be full again.
+        self._sources.set(source, bucket, bucket.capacity / self.source_rate)
+        if not bucket.try_acquire():
+            self.throttled += 1
+            raise RequestThrottledError(f"Too many guard lookups from {source!r}")
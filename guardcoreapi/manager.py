@@ -1,4 +1,9 @@
-from .core import RequestCore
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from typing import Any
+
+from .bulk import BulkItemResult, BulkReport
+from .client import GuardCoreClient
+from .core import RequestCore, ValidationMode
 from .types import (
     AdminToken,
     AdminResponse,
@@ -28,53 +33,77 @@ from .types import (
 
 class GuardCoreApi:
     @staticmethod
-    async def get_all_admin(
+    def _bind(
         api_key: str | None = None, access_token: str | None = None
-    ) -> list[AdminResponse]:
-        return await RequestCore.get(
-            "/api/admins",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            response_model=AdminResponse,
-            use_list=True,
+    ) -> GuardCoreClient:
+        return GuardCoreClient(
+            api_key=api_key, access_token=access_token, core=RequestCore.default()
+        )
+
+    @staticmethod
+    async def startup(
+        limit: int | None = None,
+        limit_per_host: int | None = None,
+        ttl_dns_cache: int | None = None,
+        keepalive_timeout: float | None = None,
+    ) -> None:
+        await RequestCore.default().startup(
+            limit=limit,
+            limit_per_host=limit_per_host,
+            ttl_dns_cache=ttl_dns_cache,
+            keepalive_timeout=keepalive_timeout,
         )
 
+    @staticmethod
+    async def shutdown() -> None:
+        await RequestCore.default().shutdown()
+
+    @staticmethod
+    async def get_all_admin(
+        api_key: str | None = None,
+        access_token: str | None = None,
+        validate: ValidationMode | None = None,
+    ) -> list[AdminResponse]:
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.get_all_admin(validate=validate)
+
+    @staticmethod
+    def stream_all_admin(
+        api_key: str | None = None,
+        access_token: str | None = None,
+        validate: ValidationMode | None = None,
+    ) -> AsyncIterator[AdminResponse]:
+        client = GuardCoreApi._bind(api_key, access_token)
+        return client.stream_all_admin(validate=validate)
+
     @staticmethod
     async def create_admin(
         data: AdminCreate, api_key: str | None = None, access_token: str | None = None
     ) -> AdminResponse:
-        return await RequestCore.post(
-            "/api/admins",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            json=data.dict(),
-            response_model=AdminResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.create_admin(data=data)
 
     @staticmethod
     async def generate_admin_token(
-        username: str, password: str, totp_code: str | None = None
+        username: str,
+        password: str,
+        totp_code: str | None = None,
+        validate: ValidationMode | None = None,
     ) -> AdminToken:
-        params = {}
-        if totp_code:
-            params["totp_code"] = totp_code
-        return await RequestCore.post(
-            "/api/admins/token",
-            params=params,
-            data={
-                "username": username,
-                "password": password,
-            },
-            response_model=AdminToken,
+        client = GuardCoreApi._bind()
+        return await client.generate_admin_token(
+            username=username,
+            password=password,
+            totp_code=totp_code,
+            validate=validate,
         )
 
     @staticmethod
     async def get_current_admin(
         api_key: str | None = None, access_token: str | None = None
     ) -> AdminResponse:
-        return await RequestCore.get(
-            "/api/admins/current",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            response_model=AdminResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.get_current_admin()
 
     @staticmethod
     async def update_current_admin(
@@ -83,32 +112,22 @@ class GuardCoreApi:
         api_key: str | None = None,
         access_token: str | None = None,
     ) -> AdminResponse:
-        return await RequestCore.put(
-            "/api/admins/current",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            json={"data": data.dict(), "code": code},
-            response_model=AdminResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.update_current_admin(data=data, code=code)
 
     @staticmethod
     async def get_current_admin_usages(
         api_key: str | None = None, access_token: str | None = None
     ) -> AdminUsageLogsResponse:
-        return await RequestCore.get(
-            "/api/admins/current/usages",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            response_model=AdminUsageLogsResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.get_current_admin_usages()
 
     @staticmethod
     async def revoke_current_admin_api_key(
         api_key: str | None = None, access_token: str | None = None
     ) -> AdminResponse:
-        return await RequestCore.post(
-            "/api/admins/current/revoke",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            response_model=AdminResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.revoke_current_admin_api_key()
 
     @staticmethod
     async def revoke_totp_secret(
@@ -116,11 +135,8 @@ class GuardCoreApi:
         api_key: str | None = None,
         access_token: str | None = None,
     ) -> dict:
-        return await RequestCore.post(
-            "/api/admins/current/totp/revoke",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            json={"code": code},
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.revoke_totp_secret(code=code)
 
     @staticmethod
     async def verify_totp_secret(
@@ -128,30 +144,22 @@ class GuardCoreApi:
         api_key: str | None = None,
         access_token: str | None = None,
     ) -> dict:
-        return await RequestCore.post(
-            "/api/admins/current/totp/verify",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            json={"code": code},
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.verify_totp_secret(code=code)
 
     @staticmethod
     async def get_current_admin_backup(
         api_key: str | None = None, access_token: str | None = None
     ) -> dict:
-        return await RequestCore.get(
-            "/api/admins/current/backup",
-            headers=RequestCore.generate_headers(api_key, access_token),
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.get_current_admin_backup()
 
     @staticmethod
     async def get_admin(
         username: str, api_key: str | None = None, access_token: str | None = None
     ) -> AdminResponse:
-        return await RequestCore.get(
-            f"/api/admins/{username}",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            response_model=AdminResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.get_admin(username=username)
 
     @staticmethod
     async def update_admin(
@@ -160,108 +168,93 @@ class GuardCoreApi:
         api_key: str | None = None,
         access_token: str | None = None,
     ) -> AdminResponse:
-        return await RequestCore.put(
-            f"/api/admins/{username}",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            json=data.dict(),
-            response_model=AdminResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.update_admin(username=username, data=data)
 
     @staticmethod
     async def delete_admin(
         username: str, api_key: str | None = None, access_token: str | None = None
     ) -> dict:
-        return await RequestCore.delete(
-            f"/api/admins/{username}",
-            headers=RequestCore.generate_headers(api_key, access_token),
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.delete_admin(username=username)
 
     @staticmethod
     async def get_admin_usages(
         username: str, api_key: str | None = None, access_token: str | None = None
     ) -> AdminUsageLogsResponse:
-        return await RequestCore.get(
-            f"/api/admins/{username}/usages",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            response_model=AdminUsageLogsResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.get_admin_usages(username=username)
 
     @staticmethod
     async def enable_admin(
         username: str, api_key: str | None = None, access_token: str | None = None
     ) -> AdminResponse:
-        return await RequestCore.post(
-            f"/api/admins/{username}/enable",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            response_model=AdminResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.enable_admin(username=username)
 
     @staticmethod
     async def disable_admin(
         username: str, api_key: str | None = None, access_token: str | None = None
     ) -> AdminResponse:
-        return await RequestCore.post(
-            f"/api/admins/{username}/disable",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            response_model=AdminResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.disable_admin(username=username)
 
     @staticmethod
     async def revoke_admin_api_key(
         username: str, api_key: str | None = None, access_token: str | None = None
     ) -> AdminResponse:
-        return await RequestCore.post(
-            f"/api/admins/{username}/revoke",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            response_model=AdminResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.revoke_admin_api_key(username=username)
 
     @staticmethod
     async def get_admin_subscriptions(
-        username: str, api_key: str | None = None, access_token: str | None = None
+        username: str,
+        api_key: str | None = None,
+        access_token: str | None = None,
+        validate: ValidationMode | None = None,
     ) -> list[SubscriptionResponse]:
-        return await RequestCore.get(
-            f"/api/admins/{username}/subscriptions",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            response_model=SubscriptionResponse,
-            use_list=True,
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.get_admin_subscriptions(
+            username=username, validate=validate
         )
 
+    @staticmethod
+    def stream_admin_subscriptions(
+        username: str,
+        api_key: str | None = None,
+        access_token: str | None = None,
+        validate: ValidationMode | None = None,
+    ) -> AsyncIterator[SubscriptionResponse]:
+        client = GuardCoreApi._bind(api_key, access_token)
+        return client.stream_admin_subscriptions(username=username, validate=validate)
+
     @staticmethod
     async def revoke_admin(
         username: str, api_key: str | None = None, access_token: str | None = None
     ) -> dict:
-        return await RequestCore.post(
-            f"/api/admins/{username}/revoke",
-            headers=RequestCore.generate_headers(api_key, access_token),
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.revoke_admin(username=username)
 
     @staticmethod
     async def delete_admin_subscriptions(
         username: str, api_key: str | None = None, access_token: str | None = None
     ) -> dict:
-        return await RequestCore.delete(
-            f"/api/admins/{username}/subscriptions",
-            headers=RequestCore.generate_headers(api_key, access_token),
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.delete_admin_subscriptions(username=username)
 
     @staticmethod
     async def activate_admin_subscriptions(
         username: str, api_key: str | None = None, access_token: str | None = None
     ) -> dict:
-        return await RequestCore.post(
-            f"/api/admins/{username}/subscriptions/activate",
-            headers=RequestCore.generate_headers(api_key, access_token),
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.activate_admin_subscriptions(username=username)
 
     @staticmethod
     async def deactivate_admin_subscriptions(
         username: str, api_key: str | None = None, access_token: str | None = None
     ) -> dict:
-        return await RequestCore.post(
-            f"/api/admins/{username}/subscriptions/deactivate",
-            headers=RequestCore.generate_headers(api_key, access_token),
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.deactivate_admin_subscriptions(username=username)
 
     @staticmethod
     async def get_all_subscriptions(
@@ -276,33 +269,105 @@ class GuardCoreApi:
         order_by: str | None = None,
         page: int | None = 1,
         size: int | None = 10,
+        validate: ValidationMode | None = None,
     ) -> list[SubscriptionResponse]:
-        params = {}
-        if limited is not None:
-            params["limited"] = limited
-        if expired is not None:
-            params["expired"] = expired
-        if is_active is not None:
-            params["is_active"] = is_active
-        if enabled is not None:
-            params["enabled"] = enabled
-        if search is not None:
-            params["search"] = search
-        if online is not None:
-            params["online"] = online
-        if order_by is not None:
-            params["order_by"] = order_by
-        if page is not None:
-            params["page"] = page
-        if size is not None:
-            params["size"] = size
-
-        return await RequestCore.get(
-            "/api/subscriptions",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            params=params,
-            response_model=SubscriptionResponse,
-            use_list=True,
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.get_all_subscriptions(
+            limited=limited,
+            expired=expired,
+            is_active=is_active,
+            enabled=enabled,
+            search=search,
+            online=online,
+            order_by=order_by,
+            page=page,
+            size=size,
+            validate=validate,
+        )
+
+    @staticmethod
+    def stream_all_subscriptions(
+        api_key: str | None = None,
+        access_token: str | None = None,
+        limited: bool | None = None,
+        expired: bool | None = None,
+        is_active: bool | None = None,
+        enabled: bool | None = None,
+        search: str | None = None,
+        online: bool | None = None,
+        order_by: str | None = None,
+        page: int | None = 1,
+        size: int | None = 10,
+        validate: ValidationMode | None = None,
+    ) -> AsyncIterator[SubscriptionResponse]:
+        client = GuardCoreApi._bind(api_key, access_token)
+        return client.stream_all_subscriptions(
+            limited=limited,
+            expired=expired,
+            is_active=is_active,
+            enabled=enabled,
+            search=search,
+            online=online,
+            order_by=order_by,
+            page=page,
+            size=size,
+            validate=validate,
+        )
+
+    @staticmethod
+    def iter_subscriptions(
+        api_key: str | None = None,
+        access_token: str | None = None,
+        limited: bool | None = None,
+        expired: bool | None = None,
+        is_active: bool | None = None,
+        enabled: bool | None = None,
+        search: str | None = None,
+        online: bool | None = None,
+        order_by: str | None = None,
+        size: int = 100,
+        prefetch: int = 2,
+        validate: ValidationMode | None = None,
+    ) -> AsyncIterator[SubscriptionResponse]:
+        client = GuardCoreApi._bind(api_key, access_token)
+        return client.iter_subscriptions(
+            limited=limited,
+            expired=expired,
+            is_active=is_active,
+            enabled=enabled,
+            search=search,
+            online=online,
+            order_by=order_by,
+            size=size,
+            prefetch=prefetch,
+            validate=validate,
+        )
+
+    @staticmethod
+    async def fetch_all_subscriptions(
+        api_key: str | None = None,
+        access_token: str | None = None,
+        limited: bool | None = None,
+        expired: bool | None = None,
+        is_active: bool | None = None,
+        enabled: bool | None = None,
+        online: bool | None = None,
+        order_by: str | None = None,
+        size: int = 100,
+        concurrency: int = 8,
+        validate: ValidationMode | None = None,
+    ) -> list[SubscriptionResponse]:
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.fetch_all_subscriptions(
+            limited=limited,
+            expired=expired,
+            is_active=is_active,
+            enabled=enabled,
+            online=online,
+            order_by=order_by,
+            size=size,
+            concurrency=concurrency,
+            validate=validate,
         )
 
     @staticmethod
@@ -311,12 +376,36 @@ class GuardCoreApi:
         api_key: str | None = None,
         access_token: str | None = None,
     ) -> SubscriptionResponse:
-        return await RequestCore.post(
-            "/api/subscriptions",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            json=[item.dict() for item in data],
-            response_model=SubscriptionResponse,
-            use_list=True,
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.create_subscription(data=data)
+
+    @staticmethod
+    def import_subscriptions(
+        data: Iterable[SubscriptionCreate],
+        api_key: str | None = None,
+        access_token: str | None = None,
+        chunk_size: int = 100,
+        concurrency: int = 4,
+        skip: Iterable[str] = (),
+    ) -> AsyncIterator[BulkItemResult]:
+        client = GuardCoreApi._bind(api_key, access_token)
+        return client.import_subscriptions(
+            data=data, chunk_size=chunk_size, concurrency=concurrency, skip=skip
+        )
+
+    @staticmethod
+    async def bulk_apply(
+        op: str | Callable[..., Awaitable[Any]],
+        usernames: Iterable[str],
+        api_key: str | None = None,
+        access_token: str | None = None,
+        concurrency: int = 16,
+        on_progress: Callable[[BulkItemResult, int, int], None] | None = None,
+        **kwargs,
+    ) -> BulkReport:
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.bulk_apply(
+            op, usernames, concurrency=concurrency, on_progress=on_progress, **kwargs
         )
 
     @staticmethod
@@ -329,43 +418,31 @@ class GuardCoreApi:
         enabled: bool | None = None,
         online: bool | None = None,
     ) -> int:
-        params = {}
-        if limited is not None:
-            params["limited"] = limited
-        if expired is not None:
-            params["expired"] = expired
-        if is_active is not None:
-            params["is_active"] = is_active
-        if enabled is not None:
-            params["enabled"] = enabled
-        if online is not None:
-            params["online"] = online
-
-        return await RequestCore.get(
-            "/api/subscriptions/count",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            params=params,
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.get_subscription_count(
+            limited=limited,
+            expired=expired,
+            is_active=is_active,
+            enabled=enabled,
+            online=online,
         )
 
     @staticmethod
     async def get_subscription_stats(
         api_key: str | None = None, access_token: str | None = None
     ) -> SubscriptionStatsResponse:
-        return await RequestCore.get(
-            "/api/subscriptions/stats",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            response_model=SubscriptionStatsResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.get_subscription_stats()
 
     @staticmethod
     async def get_subscription(
-        username: str, api_key: str | None = None, access_token: str | None = None
+        username: str,
+        api_key: str | None = None,
+        access_token: str | None = None,
+        validate: ValidationMode | None = None,
     ) -> SubscriptionResponse:
-        return await RequestCore.get(
-            f"/api/subscriptions/{username}",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            response_model=SubscriptionResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.get_subscription(username=username, validate=validate)
 
     @staticmethod
     async def update_subscription(
@@ -374,131 +451,94 @@ class GuardCoreApi:
         api_key: str | None = None,
         access_token: str | None = None,
     ) -> SubscriptionResponse:
-        return await RequestCore.put(
-            f"/api/subscriptions/{username}",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            json=data.dict(),
-            response_model=SubscriptionResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.update_subscription(username=username, data=data)
 
     @staticmethod
     async def delete_subscription(
         username: str, api_key: str | None = None, access_token: str | None = None
     ) -> dict:
-        return await RequestCore.delete(
-            f"/api/subscriptions/{username}",
-            headers=RequestCore.generate_headers(api_key, access_token),
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.delete_subscription(username=username)
 
     @staticmethod
     async def get_subscription_usages(
         username: str, api_key: str | None = None, access_token: str | None = None
     ) -> SubscriptionUsageLogsResponse:
-        return await RequestCore.get(
-            f"/api/subscriptions/{username}/usages",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            response_model=SubscriptionUsageLogsResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.get_subscription_usages(username=username)
 
     @staticmethod
     async def enable_subscription(
         username: str, api_key: str | None = None, access_token: str | None = None
     ) -> SubscriptionResponse:
-        return await RequestCore.post(
-            f"/api/subscriptions/{username}/enable",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            response_model=SubscriptionResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.enable_subscription(username=username)
 
     @staticmethod
     async def disable_subscription(
         username: str, api_key: str | None = None, access_token: str | None = None
     ) -> SubscriptionResponse:
-        return await RequestCore.post(
-            f"/api/subscriptions/{username}/disable",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            response_model=SubscriptionResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.disable_subscription(username=username)
 
     @staticmethod
     async def revoke_subscription(
         username: str, api_key: str | None = None, access_token: str | None = None
     ) -> SubscriptionResponse:
-        return await RequestCore.post(
-            f"/api/subscriptions/{username}/revoke",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            response_model=SubscriptionResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.revoke_subscription(username=username)
 
     @staticmethod
     async def reset_subscription(
         username: str, api_key: str | None = None, access_token: str | None = None
     ) -> SubscriptionResponse:
-        return await RequestCore.post(
-            f"/api/subscriptions/{username}/reset",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            response_model=SubscriptionResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.reset_subscription(username=username)
 
     @staticmethod
     async def bulk_add_service(
         service_id: int, api_key: str | None = None, access_token: str | None = None
     ) -> dict:
-        return await RequestCore.post(
-            f"/api/subscriptions/services/{service_id}",
-            headers=RequestCore.generate_headers(api_key, access_token),
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.bulk_add_service(service_id=service_id)
 
     @staticmethod
     async def bulk_remove_service(
         service_id: int, api_key: str | None = None, access_token: str | None = None
     ) -> dict:
-        return await RequestCore.delete(
-            f"/api/subscriptions/services/{service_id}",
-            headers=RequestCore.generate_headers(api_key, access_token),
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.bulk_remove_service(service_id=service_id)
 
     @staticmethod
     async def get_nodes(
-        api_key: str | None = None, access_token: str | None = None
+        api_key: str | None = None,
+        access_token: str | None = None,
+        validate: ValidationMode | None = None,
     ) -> list[NodeResponse]:
-        return await RequestCore.get(
-            "/api/nodes",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            response_model=NodeResponse,
-            use_list=True,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.get_nodes(validate=validate)
 
     @staticmethod
     async def create_node(
         data: NodeCreate, api_key: str | None = None, access_token: str | None = None
     ) -> NodeResponse:
-        return await RequestCore.post(
-            "/api/nodes",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            json=data.dict(),
-            response_model=NodeResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.create_node(data=data)
 
     @staticmethod
     async def get_node_stats(
         api_key: str | None = None, access_token: str | None = None
     ) -> NodeStatsResponse:
-        return await RequestCore.get(
-            "/api/nodes/stats",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            response_model=NodeStatsResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.get_node_stats()
 
     @staticmethod
     async def get_node(
         node_id: int, api_key: str | None = None, access_token: str | None = None
     ) -> NodeResponse:
-        return await RequestCore.get(
-            f"/api/nodes/{node_id}",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            response_model=NodeResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.get_node(node_id=node_id)
 
     @staticmethod
     async def update_node(
@@ -507,73 +547,52 @@ class GuardCoreApi:
         api_key: str | None = None,
         access_token: str | None = None,
     ) -> NodeResponse:
-        return await RequestCore.put(
-            f"/api/nodes/{node_id}",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            json=data.dict(),
-            response_model=NodeResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.update_node(node_id=node_id, data=data)
 
     @staticmethod
     async def delete_node(
         node_id: int, api_key: str | None = None, access_token: str | None = None
     ) -> dict:
-        return await RequestCore.delete(
-            f"/api/nodes/{node_id}",
-            headers=RequestCore.generate_headers(api_key, access_token),
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.delete_node(node_id=node_id)
 
     @staticmethod
     async def enable_node(
         node_id: int, api_key: str | None = None, access_token: str | None = None
     ) -> NodeResponse:
-        return await RequestCore.post(
-            f"/api/nodes/{node_id}/enable",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            response_model=NodeResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.enable_node(node_id=node_id)
 
     @staticmethod
     async def disable_node(
         node_id: int, api_key: str | None = None, access_token: str | None = None
     ) -> NodeResponse:
-        return await RequestCore.post(
-            f"/api/nodes/{node_id}/disable",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            response_model=NodeResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.disable_node(node_id=node_id)
 
     @staticmethod
     async def get_services(
-        api_key: str | None = None, access_token: str | None = None
+        api_key: str | None = None,
+        access_token: str | None = None,
+        validate: ValidationMode | None = None,
     ) -> list[ServiceResponse]:
-        return await RequestCore.get(
-            "/api/services",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            response_model=ServiceResponse,
-            use_list=True,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.get_services(validate=validate)
 
     @staticmethod
     async def create_service(
         data: ServiceCreate, api_key: str | None = None, access_token: str | None = None
     ) -> ServiceResponse:
-        return await RequestCore.post(
-            "/api/services",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            json=data.dict(),
-            response_model=ServiceResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.create_service(data=data)
 
     @staticmethod
     async def get_service(
         service_id: int, api_key: str | None = None, access_token: str | None = None
     ) -> ServiceResponse:
-        return await RequestCore.get(
-            f"/api/services/{service_id}",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            response_model=ServiceResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.get_service(service_id=service_id)
 
     @staticmethod
     async def update_service(
@@ -582,50 +601,37 @@ class GuardCoreApi:
         api_key: str | None = None,
         access_token: str | None = None,
     ) -> ServiceResponse:
-        return await RequestCore.put(
-            f"/api/services/{service_id}",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            json=data.dict(),
-            response_model=ServiceResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.update_service(service_id=service_id, data=data)
 
     @staticmethod
     async def delete_service(
         service_id: int, api_key: str | None = None, access_token: str | None = None
     ) -> dict:
-        return await RequestCore.delete(
-            f"/api/services/{service_id}",
-            headers=RequestCore.generate_headers(api_key, access_token),
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.delete_service(service_id=service_id)
 
     @staticmethod
     async def get_guard(secret: str) -> list[str]:
-        return await RequestCore.get(
-            f"/guards/{secret}",
-        )
+        client = GuardCoreApi._bind()
+        return await client.get_guard(secret=secret)
 
     @staticmethod
     async def get_guard_info(secret: str) -> SubscriptionResponse:
-        return await RequestCore.get(
-            f"/guards/{secret}/info",
-        )
+        client = GuardCoreApi._bind()
+        return await client.get_guard_info(secret=secret)
 
     @staticmethod
     async def get_guard_usage_logs(secret: str) -> SubscriptionUsageLogsResponse:
-        return await RequestCore.get(
-            f"/guards/{secret}/usages",
-            response_model=SubscriptionUsageLogsResponse,
-        )
+        client = GuardCoreApi._bind()
+        return await client.get_guard_usage_logs(secret=secret)
 
     @staticmethod
     async def get_subscription_status_stats(
         api_key: str | None = None, access_token: str | None = None
     ) -> SubscriptionStatusStatsResponse:
-        return await RequestCore.get(
-            "/api/stats/subscriptions/status",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            response_model=SubscriptionStatusStatsResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.get_subscription_status_stats()
 
     @staticmethod
     async def get_most_usage_subscriptions(
@@ -634,11 +640,9 @@ class GuardCoreApi:
         api_key: str | None = None,
         access_token: str | None = None,
     ) -> MostUsageSubscription:
-        return await RequestCore.get(
-            "/api/stats/subscriptions/most_usage",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            params={"start_date": start_date, "end_date": end_date},
-            response_model=MostUsageSubscription,
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.get_most_usage_subscriptions(
+            start_date=start_date, end_date=end_date
         )
 
     @staticmethod
@@ -648,22 +652,15 @@ class GuardCoreApi:
         api_key: str | None = None,
         access_token: str | None = None,
     ) -> UsageStatsResponse:
-        return await RequestCore.get(
-            "/api/stats/usage",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            params={"start_date": start_date, "end_date": end_date},
-            response_model=UsageStatsResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.get_usage_stats(start_date=start_date, end_date=end_date)
 
     @staticmethod
     async def get_agent_stats(
         api_key: str | None = None, access_token: str | None = None
     ) -> AgentStatsResponse:
-        return await RequestCore.get(
-            "/api/stats/agents",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            response_model=AgentStatsResponse,
-        )
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.get_agent_stats()
 
     @staticmethod
     async def get_last_reached_subscriptions(
@@ -674,15 +671,7 @@ class GuardCoreApi:
         api_key: str | None = None,
         access_token: str | None = None,
     ) -> list[LastReachedSubscriptionDetail]:
-        params = {"page": page, "size": size}
-        if start_date:
-            params["start_date"] = start_date
-        if end_date:
-            params["end_date"] = end_date
-        return await RequestCore.get(
-            "/api/stats/subscriptions/reacheds",
-            headers=RequestCore.generate_headers(api_key, access_token),
-            params=params,
-            response_model=LastReachedSubscriptionDetail,
-            use_list=True,
+        client = GuardCoreApi._bind(api_key, access_token)
+        return await client.get_last_reached_subscriptions(
+            page=page, size=size, start_date=start_date, end_date=end_date
         )
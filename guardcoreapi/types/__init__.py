@@ -1,45 +1,100 @@
-from .admins import (
-    AdminPlaceHolderCategory,
-    AdminPlaceHolder,
-    AdminRole,
-    AdminToken,
-    AdminResponse,
-    ADMIN_PLACEHOLDER_REMARK_FORMATS,
-    AdminCreate,
-    AdminCurrentUpdate,
-    AdminUpdate,
-    AdminUsageLog,
-    AdminUsageLogsResponse,
-)
-from .subscriptions import (
-    AutoRenewalCreate,
-    AutoRenewalResponse,
-    AutoRenewalUpdate,
-    SubscriptionCreate,
-    SubscriptionResponse,
-    SubscriptionUpdate,
-    SubscriptionUsageLog,
-    SubscriptionUsageLogsResponse,
-    SubscriptionStatsResponse,
-)
-from .nodes import (
-    NodeCategory,
-    NodeResponse,
-    NodeCreate,
-    NodeUpdate,
-    NodeStatsResponse,
-)
-from .services import ServiceResponse, ServiceCreate, ServiceUpdate
-from .stats import (
-    UsageDetail,
-    UsageSubscriptionDetail,
-    AgentStatsDetail,
-    SubscriptionStatusStatsResponse,
-    MostUsageSubscription,
-    UsageStatsResponse,
-    AgentStatsResponse,
-    LastReachedSubscriptionDetail,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .admins import (
+        AdminPlaceHolderCategory,
+        AdminPlaceHolder,
+        AdminRole,
+        AdminToken,
+        AdminResponse,
+        ADMIN_PLACEHOLDER_REMARK_FORMATS,
+        AdminCreate,
+        AdminCurrentUpdate,
+        AdminUpdate,
+        AdminUsageLog,
+        AdminUsageLogsResponse,
+    )
+    from .subscriptions import (
+        AutoRenewalCreate,
+        AutoRenewalResponse,
+        AutoRenewalUpdate,
+        SubscriptionCreate,
+        SubscriptionResponse,
+        SubscriptionUpdate,
+        SubscriptionUsageLog,
+        SubscriptionUsageLogsResponse,
+        SubscriptionStatsResponse,
+    )
+    from .nodes import (
+        NodeCategory,
+        NodeResponse,
+        NodeCreate,
+        NodeUpdate,
+        NodeStatsResponse,
+    )
+    from .records import (
+        AutoRenewalRecord,
+        SubscriptionRecord,
+        SubscriptionUsageRecord,
+        AdminUsageRecord,
+        NodeRecord,
+    )
+    from .services import ServiceResponse, ServiceCreate, ServiceUpdate
+    from .stats import (
+        UsageDetail,
+        UsageSubscriptionDetail,
+        AgentStatsDetail,
+        SubscriptionStatusStatsResponse,
+        MostUsageSubscription,
+        UsageStatsResponse,
+        AgentStatsResponse,
+        LastReachedSubscriptionDetail,
+    )
+
+_LAZY = {
+    "AdminPlaceHolderCategory": ".admins",
+    "AdminPlaceHolder": ".admins",
+    "AdminRole": ".admins",
+    "AdminToken": ".admins",
+    "AdminResponse": ".admins",
+    "ADMIN_PLACEHOLDER_REMARK_FORMATS": ".admins",
+    "AdminCreate": ".admins",
+    "AdminCurrentUpdate": ".admins",
+    "AdminUpdate": ".admins",
+    "AdminUsageLog": ".admins",
+    "AdminUsageLogsResponse": ".admins",
+    "AutoRenewalCreate": ".subscriptions",
+    "AutoRenewalResponse": ".subscriptions",
+    "AutoRenewalUpdate": ".subscriptions",
+    "SubscriptionCreate": ".subscriptions",
+    "SubscriptionResponse": ".subscriptions",
+    "SubscriptionUpdate": ".subscriptions",
+    "SubscriptionUsageLog": ".subscriptions",
+    "SubscriptionUsageLogsResponse": ".subscriptions",
+    "SubscriptionStatsResponse": ".subscriptions",
+    "NodeCategory": ".nodes",
+    "NodeResponse": ".nodes",
+    "NodeCreate": ".nodes",
+    "NodeUpdate": ".nodes",
+    "NodeStatsResponse": ".nodes",
+    "AutoRenewalRecord": ".records",
+    "SubscriptionRecord": ".records",
+    "SubscriptionUsageRecord": ".records",
+    "AdminUsageRecord": ".records",
+    "NodeRecord": ".records",
+    "ServiceResponse": ".services",
+    "ServiceCreate": ".services",
+    "ServiceUpdate": ".services",
+    "UsageDetail": ".stats",
+    "UsageSubscriptionDetail": ".stats",
+    "AgentStatsDetail": ".stats",
+    "SubscriptionStatusStatsResponse": ".stats",
+    "MostUsageSubscription": ".stats",
+    "UsageStatsResponse": ".stats",
+    "AgentStatsResponse": ".stats",
+    "LastReachedSubscriptionDetail": ".stats",
+}
 
 __all__ = [
     "AdminPlaceHolderCategory",
@@ -67,6 +122,11 @@ __all__ = [
     "NodeCreate",
     "NodeUpdate",
     "NodeStatsResponse",
+    "AutoRenewalRecord",
+    "SubscriptionRecord",
+    "SubscriptionUsageRecord",
+    "AdminUsageRecord",
+    "NodeRecord",
     "ServiceResponse",
     "ServiceCreate",
     "ServiceUpdate",
@@ -79,3 +139,16 @@ __all__ = [
     "AgentStatsResponse",
     "LastReachedSubscriptionDetail",
 ]
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
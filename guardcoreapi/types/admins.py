@@ -1,7 +1,7 @@
 from enum import StrEnum
 from typing import Optional
 from datetime import datetime
-from pydantic import BaseModel
+from .base import GuardModel
 
 
 class AdminPlaceHolderCategory(StrEnum):
@@ -29,7 +29,7 @@ ADMIN_PLACEHOLDER_REMARK_FORMATS = [
 ]
 
 
-class AdminPlaceHolder(BaseModel):
+class AdminPlaceHolder(GuardModel):
     remark: str
     uuid: Optional[str] = None
     address: Optional[str] = None
@@ -43,12 +43,12 @@ class AdminRole(StrEnum):
     RESELLER = "reseller"
 
 
-class AdminToken(BaseModel):
+class AdminToken(GuardModel):
     access_token: str
     token_type: str = "bearer"
 
 
-class AdminResponse(BaseModel):
+class AdminResponse(GuardModel):
     id: int
     enabled: bool
     username: str
@@ -99,7 +99,7 @@ class AdminResponse(BaseModel):
         from_attributes = True
 
 
-class AdminCreate(BaseModel):
+class AdminCreate(GuardModel):
     username: str
     password: str
     role: AdminRole
@@ -133,7 +133,7 @@ class AdminCreate(BaseModel):
     announce_url: Optional[str] = None
 
 
-class AdminUpdate(BaseModel):
+class AdminUpdate(GuardModel):
     password: Optional[str] = None
     create_access: Optional[bool] = None
     update_access: Optional[bool] = None
@@ -166,7 +166,7 @@ class AdminUpdate(BaseModel):
     totp_status: Optional[bool] = None
 
 
-class AdminCurrentUpdate(BaseModel):
+class AdminCurrentUpdate(GuardModel):
     password: Optional[str] = None
     placeholders: Optional[list[AdminPlaceHolder]] = None
     max_links: Optional[int] = None
@@ -192,11 +192,11 @@ class AdminCurrentUpdate(BaseModel):
     totp_status: Optional[bool] = None
 
 
-class AdminUsageLog(BaseModel):
+class AdminUsageLog(GuardModel):
     usage: int
     created_at: datetime
 
 
-class AdminUsageLogsResponse(BaseModel):
+class AdminUsageLogsResponse(GuardModel):
     admin: AdminResponse
     usages: list[AdminUsageLog]
@@ -0,0 +1,11 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class GuardModel(BaseModel):
+    """Base for the API models.
+
+    Validators are built on first use instead of at import time, so
+    importing the package stays cheap for callers that touch few models.
+    """
+
+    model_config = ConfigDict(defer_build=True)
@@ -1,6 +1,6 @@
 from enum import StrEnum
 from datetime import datetime
-from pydantic import BaseModel
+from .base import GuardModel
 
 
 class NodeCategory(StrEnum):
@@ -9,7 +9,7 @@ class NodeCategory(StrEnum):
     rustneshin = "rustneshin"
 
 
-class NodeResponse(BaseModel):
+class NodeResponse(GuardModel):
     id: int
     enabled: bool
     remark: str
@@ -30,7 +30,7 @@ class NodeResponse(BaseModel):
         from_attributes = True
 
 
-class NodeCreate(BaseModel):
+class NodeCreate(GuardModel):
     remark: str
     category: NodeCategory
     username: str
@@ -42,7 +42,7 @@ class NodeCreate(BaseModel):
     usage_rate: float = 1.0
 
 
-class NodeUpdate(BaseModel):
+class NodeUpdate(GuardModel):
     remark: str | None = None
     username: str | None = None
     password: str | None = None
@@ -53,7 +53,7 @@ class NodeUpdate(BaseModel):
     usage_rate: float | None = None
 
 
-class NodeStatsResponse(BaseModel):
+class NodeStatsResponse(GuardModel):
     total_nodes: int
     active_nodes: int
     inactive_nodes: int
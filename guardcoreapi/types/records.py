@@ -0,0 +1,124 @@
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import ClassVar, Optional
+
+from pydantic import BaseModel
+
+from .admins import AdminUsageLog
+from .nodes import NodeCategory, NodeResponse
+from .subscriptions import (
+    AutoRenewalResponse,
+    SubscriptionResponse,
+    SubscriptionUsageLog,
+)
+
+
+class _Record:
+    """Conversion helpers shared by the compact record types.
+
+    Records are frozen ``__slots__`` dataclasses: no per-instance ``__dict__``
+    or pydantic bookkeeping, and lists are stored as tuples.
+    """
+
+    __slots__ = ()
+    _model: ClassVar[type[BaseModel]]
+    _nested: ClassVar[dict[str, type["_Record"]]] = {}
+
+    @classmethod
+    def from_model(cls, model: BaseModel):
+        values = {}
+        for field in fields(cls):
+            value = getattr(model, field.name)
+            if field.name in cls._nested:
+                value = tuple(map(cls._nested[field.name].from_model, value))
+            elif isinstance(value, list):
+                value = tuple(value)
+            values[field.name] = value
+        return cls(**values)
+
+    def to_model(self) -> BaseModel:
+        return self._model.model_validate(self, from_attributes=True)
+
+
+@dataclass(frozen=True, slots=True)
+class AutoRenewalRecord(_Record):
+    _model: ClassVar[type[BaseModel]] = AutoRenewalResponse
+
+    id: int
+    limit_expire: Optional[int]
+    limit_usage: Optional[int]
+    reset_usage: bool
+
+
+@dataclass(frozen=True, slots=True)
+class SubscriptionRecord(_Record):
+    _model: ClassVar[type[BaseModel]] = SubscriptionResponse
+    _nested: ClassVar[dict[str, type[_Record]]] = {"auto_renewals": AutoRenewalRecord}
+
+    id: int
+    username: str
+    owner_username: str
+    access_key: str
+    enabled: bool
+    activated: bool
+    reached: bool
+    limited: bool
+    expired: bool
+    is_active: bool
+    is_online: bool
+    link: str
+    limit_usage: int
+    reset_usage: int
+    total_usage: int
+    current_usage: int
+    limit_expire: int
+    auto_delete_days: int
+    service_ids: tuple[int, ...]
+    note: Optional[str]
+    telegram_id: Optional[str]
+    discord_webhook_url: Optional[str]
+    online_at: Optional[datetime]
+    last_reset_at: Optional[datetime]
+    last_revoke_at: Optional[datetime]
+    last_request_at: Optional[datetime]
+    last_client_agent: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+    auto_renewals: tuple[AutoRenewalRecord, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class SubscriptionUsageRecord(_Record):
+    _model: ClassVar[type[BaseModel]] = SubscriptionUsageLog
+
+    usage: int
+    created_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class AdminUsageRecord(_Record):
+    _model: ClassVar[type[BaseModel]] = AdminUsageLog
+
+    usage: int
+    created_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class NodeRecord(_Record):
+    _model: ClassVar[type[BaseModel]] = NodeResponse
+
+    id: int
+    enabled: bool
+    remark: str
+    category: NodeCategory
+    username: str
+    password: str
+    host: str
+    current_usage: int
+    last_used_at: datetime | None
+    usage_rate: float | None
+    offset_link: int
+    batch_size: int
+    priority: int
+    created_at: datetime
+    updated_at: datetime
@@ -1,8 +1,8 @@
 from typing import List
-from pydantic import BaseModel
+from .base import GuardModel
 
 
-class ServiceResponse(BaseModel):
+class ServiceResponse(GuardModel):
     id: int
     remark: str
     node_ids: List[int]
@@ -12,11 +12,11 @@ class ServiceResponse(BaseModel):
         from_attributes = True
 
 
-class ServiceCreate(BaseModel):
+class ServiceCreate(GuardModel):
     remark: str
     node_ids: List[int]
 
 
-class ServiceUpdate(BaseModel):
+class ServiceUpdate(GuardModel):
     remark: str | None = None
     node_ids: List[int] | None = None
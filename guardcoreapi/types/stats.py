@@ -1,25 +1,25 @@
 from datetime import datetime
-from pydantic import BaseModel
+from .base import GuardModel
 
 
-class UsageDetail(BaseModel):
+class UsageDetail(GuardModel):
     start_date: datetime
     end_date: datetime
     usage: int
 
 
-class UsageSubscriptionDetail(BaseModel):
+class UsageSubscriptionDetail(GuardModel):
     username: str
     usage: int
     is_active: bool
 
 
-class AgentStatsDetail(BaseModel):
+class AgentStatsDetail(GuardModel):
     category: str
     count: int
 
 
-class SubscriptionStatusStatsResponse(BaseModel):
+class SubscriptionStatusStatsResponse(GuardModel):
     total: int
     active: int
     disabled: int
@@ -34,25 +34,25 @@ class SubscriptionStatusStatsResponse(BaseModel):
     last_24h_usage: int
 
 
-class LastReachedSubscriptionDetail(BaseModel):
+class LastReachedSubscriptionDetail(GuardModel):
     username: str
     reached_at: datetime
     limited: bool
     expired: bool
 
 
-class MostUsageSubscription(BaseModel):
+class MostUsageSubscription(GuardModel):
     subscriptions: list[UsageSubscriptionDetail]
     start_date: datetime
     end_date: datetime
 
 
-class UsageStatsResponse(BaseModel):
+class UsageStatsResponse(GuardModel):
     total: int
     usages: list[UsageDetail]
     start_date: datetime
     end_date: datetime
 
 
-class AgentStatsResponse(BaseModel):
+class AgentStatsResponse(GuardModel):
     agents: list[AgentStatsDetail]
@@ -1,29 +1,29 @@
 from typing import Optional
 from datetime import datetime
-from pydantic import BaseModel
+from .base import GuardModel
 
 
-class AutoRenewalCreate(BaseModel):
+class AutoRenewalCreate(GuardModel):
     limit_expire: int
     limit_usage: int
     reset_usage: bool = False
 
 
-class AutoRenewalResponse(BaseModel):
+class AutoRenewalResponse(GuardModel):
     id: int
     limit_expire: Optional[int]
     limit_usage: Optional[int]
     reset_usage: bool
 
 
-class AutoRenewalUpdate(BaseModel):
+class AutoRenewalUpdate(GuardModel):
     id: int
     limit_expire: Optional[int]
     limit_usage: Optional[int]
     reset_usage: Optional[bool]
 
 
-class SubscriptionResponse(BaseModel):
+class SubscriptionResponse(GuardModel):
     id: int
     username: str
     owner_username: str
@@ -65,7 +65,7 @@ class SubscriptionResponse(BaseModel):
         from_attributes = True
 
 
-class SubscriptionCreate(BaseModel):
+class SubscriptionCreate(GuardModel):
     username: str
     limit_usage: int
     limit_expire: int
@@ -78,7 +78,7 @@ class SubscriptionCreate(BaseModel):
     auto_renewals: Optional[list[AutoRenewalCreate]] = []
 
 
-class SubscriptionUpdate(BaseModel):
+class SubscriptionUpdate(GuardModel):
     username: Optional[str] = None
     limit_usage: Optional[int] = None
     limit_expire: Optional[int] = None
@@ -90,17 +90,17 @@ class SubscriptionUpdate(BaseModel):
     auto_renewals: Optional[list[AutoRenewalUpdate]] = None
 
 
-class SubscriptionUsageLog(BaseModel):
+class SubscriptionUsageLog(GuardModel):
     usage: int
     created_at: datetime
 
 
-class SubscriptionUsageLogsResponse(BaseModel):
+class SubscriptionUsageLogsResponse(GuardModel):
     subscription: SubscriptionResponse
     usages: list[SubscriptionUsageLog]
 
 
-class SubscriptionStatsResponse(BaseModel):
+class SubscriptionStatsResponse(GuardModel):
     total: int
     active: int
     inactive: int
@@ -0,0 +1,85 @@
+import asyncio
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from guardcoreapi import GuardCoreClient
+from guardcoreapi.core import (
+    CircuitBreaker,
+    GuardCoreApiException,
+    RequestMetrics,
+    RequestResponseError,
+)
+from guardcoreapi.core.breaker import endpoint_group
+
+
+def test_endpoint_group_stops_at_placeholder():
+    assert endpoint_group("/guards/{secret}") == "/guards"
+    assert endpoint_group("/guards/{secret}/info") == "/guards"
+    assert endpoint_group("/api/subscriptions/{username}") == "/api/subscriptions"
+    assert endpoint_group("/api/nodes") == "/api/nodes"
+
+
+def test_distinct_guard_secrets_share_one_circuit():
+    async def guard(request: web.Request) -> web.Response:
+        return web.json_response([])
+
+    async def guard_info(request: web.Request) -> web.Response:
+        return web.Response(status=503)
+
+    async def main():
+        app = web.Application()
+        app.router.add_get("/guards/{secret}", guard)
+        app.router.add_get("/guards/{secret}/info", guard_info)
+        server = TestServer(app)
+        await server.start_server()
+        breaker = CircuitBreaker(min_requests=10)
+        try:
+            async with GuardCoreClient(
+                base_url=str(server.make_url("")), breaker=breaker
+            ) as client:
+                for index in range(10):
+                    await client.get_guard(f"{index:016x}")
+                for index in range(10):
+                    try:
+                        await client.get_guard_info(f"{index:016x}")
+                    except RequestResponseError:
+                        pass
+        finally:
+            await server.close()
+        return breaker.stats()
+
+    stats = asyncio.run(main())
+    assert list(stats["groups"]) == ["/guards"]
+    assert stats["groups"]["/guards"]["requests"] == 20
+    assert stats["groups"]["/guards"]["state"] == "open"
+
+
+def test_refused_requests_are_counted_per_route():
+    async def nodes(request: web.Request) -> web.Response:
+        return web.Response(status=503)
+
+    async def main():
+        app = web.Application()
+        app.router.add_get("/api/nodes", nodes)
+        server = TestServer(app)
+        await server.start_server()
+        metrics = RequestMetrics()
+        try:
+            async with GuardCoreClient(
+                base_url=str(server.make_url("")),
+                breaker=CircuitBreaker(min_requests=3, open_for=60),
+                metrics=metrics,
+            ) as client:
+                for _ in range(6):
+                    try:
+                        await client.get_nodes()
+                    except GuardCoreApiException:
+                        pass
+        finally:
+            await server.close()
+        return metrics.stats()
+
+    route = asyncio.run(main())["GET /api/nodes"]
+    assert route["errors"] == {"RequestResponseError": 3, "CircuitOpenError": 3}
+    assert route["latency"]["count"] == 3
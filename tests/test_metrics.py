@@ -0,0 +1,23 @@
+from guardcoreapi.core import Histogram
+
+
+def test_quantiles_never_exceed_the_largest_value():
+    histogram = Histogram((0.1, 1.0))
+    for value in [0.05] * 99 + [0.116]:
+        histogram.observe(value)
+    stats = histogram.stats()
+    assert stats["max"] == 0.116
+    assert stats["p50"] <= stats["p99"] <= stats["max"]
+
+
+def test_values_above_the_top_bucket_are_bounded_by_max():
+    histogram = Histogram((0.1, 1.0))
+    for value in (1.7, 1.8, 1.9):
+        histogram.observe(value)
+    assert 1.0 <= histogram.quantile(0.5) <= 1.9
+    assert histogram.quantile(0.99) <= 1.9
+
+
+def test_empty_histogram():
+    stats = Histogram((1.0,)).stats()
+    assert stats["p50"] is None and stats["max"] is None
@@ -0,0 +1,55 @@
+import pytest
+
+from guardcoreapi.core.stream import JSONArrayDecoder
+
+
+def _decode(data: bytes, size: int) -> list:
+    decoder = JSONArrayDecoder()
+    items = []
+    for start in range(0, len(data), size):
+        items.extend(decoder.feed(data[start : start + size]))
+    return items + decoder.close()
+
+
+@pytest.mark.parametrize("data", [b"[1,,2]", b"[,1]", b"[1,]", b"[,]", b"[1 2]", b"[1"])
+@pytest.mark.parametrize("size", [1, 2, 64])
+def test_rejects_malformed_arrays(data, size):
+    with pytest.raises(ValueError):
+        _decode(data, size)
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (b"[]", []),
+        (b' [ 1 , "a,b" , {"c": [2, 3]} ] ', [1, "a,b", {"c": [2, 3]}]),
+        ('["é", "日本"]'.encode(), ["é", "日本"]),
+        (b"[12345, 678]", [12345, 678]),
+        (b"[true, false, null]", [True, False, None]),
+    ],
+)
+@pytest.mark.parametrize("size", [1, 2, 3, 64])
+def test_values_split_across_chunks(data, expected, size):
+    assert _decode(data, size) == expected
+
+
+def test_number_is_not_cut_at_chunk_boundary():
+    decoder = JSONArrayDecoder()
+    assert decoder.feed(b"[12") == []
+    assert decoder.feed(b"34]") == [1234]
+    assert decoder.close() == []
+
+
+def test_true_split_across_chunks():
+    decoder = JSONArrayDecoder()
+    assert decoder.feed(b"[tr") == []
+    assert decoder.feed(b"ue]") == [True]
+    assert decoder.close() == []
+
+
+def test_utf8_character_split_across_chunks():
+    data = '["é"]'.encode()
+    decoder = JSONArrayDecoder()
+    assert decoder.feed(data[:3]) == []
+    assert decoder.feed(data[3:]) == ["é"]
+    assert decoder.close() == []
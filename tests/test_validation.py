@@ -0,0 +1,27 @@
+import copy
+import pickle
+
+import pytest
+
+from guardcoreapi.core import LazyModel
+from guardcoreapi.types import NodeResponse
+
+from benchmarks import payloads
+
+
+@pytest.mark.parametrize(
+    "clone",
+    [copy.copy, copy.deepcopy, lambda item: pickle.loads(pickle.dumps(item))],
+)
+def test_lazy_model_copies(clone):
+    item = LazyModel(NodeResponse, payloads.node(1))
+    item.id
+    cloned = clone(item)
+    assert cloned.id == item.id
+    assert cloned.to_model() == item.to_model()
+
+
+def test_lazy_model_private_names_raise_attribute_error():
+    item = LazyModel(NodeResponse, payloads.node(1))
+    with pytest.raises(AttributeError):
+        item._missing